@@ -7,6 +7,7 @@ This example demonstrates a complete workflow:
 """
 
 import sys
+from collections import Counter
 from pathlib import Path
 from datetime import datetime, timedelta
 
@@ -94,24 +95,22 @@ def main():
     print("\n[Step 4] Test Execution Summary")
     print("-" * 60)
     
-    successful = [r for r in results if 'error' not in r]
-    failed = [r for r in results if 'error' in r]
+    failed = sum('error' in r for r in results)
+    successful = len(results) - failed
     
     print(f"Test Cycle ID: {test_cycle['id']}")
     print(f"Test Run ID: {test_run['id']}")
     print(f"Total Test Cases: {len(test_results)}")
-    print(f"Results Updated: {len(successful)}")
-    print(f"Update Failures: {len(failed)}")
+    print(f"Results Updated: {successful}")
+    print(f"Update Failures: {failed}")
     
     # Count by status
-    passed = sum(1 for r in test_results if r['status'] == 'PASSED')
-    failed_tests = sum(1 for r in test_results if r['status'] == 'FAILED')
-    skipped = sum(1 for r in test_results if r['status'] == 'SKIPPED')
+    status_counts = Counter(r['status'] for r in test_results)
     
     print(f"\nTest Results:")
-    print(f"  ✓ Passed: {passed}")
-    print(f"  ✗ Failed: {failed_tests}")
-    print(f"  ⊘ Skipped: {skipped}")
+    print(f"  ✓ Passed: {status_counts['PASSED']}")
+    print(f"  ✗ Failed: {status_counts['FAILED']}")
+    print(f"  ⊘ Skipped: {status_counts['SKIPPED']}")
     
     print("\n" + "=" * 60)
     print("Workflow completed successfully!")
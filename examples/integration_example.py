@@ -56,7 +56,8 @@ class QTestReporter:
         
         print(f"\nTest Run Completed: ID {self.test_run_id}")
         print(f"Total Results: {len(results)}")
-        print(f"Successfully Updated: {len([r for r in results if 'error' not in r])}")
+        failed = sum('error' in r for r in results)
+        print(f"Successfully Updated: {len(results) - failed}")
         
         return results
 
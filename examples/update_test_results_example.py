@@ -72,8 +72,9 @@ def main():
     
     print(f"\nBulk update completed!")
     print(f"Total results updated: {len(results)}")
-    print(f"Successful: {len([r for r in results if 'error' not in r])}")
-    print(f"Failed: {len([r for r in results if 'error' in r])}")
+    failed = sum('error' in r for r in results)
+    print(f"Successful: {len(results) - failed}")
+    print(f"Failed: {failed}")
     
     # Example 4: Get available statuses
     print("\nAvailable execution statuses:")
@@ -4,11 +4,117 @@ Handles all HTTP requests to QTest API
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
 import json
 import logging
-from typing import Dict, List, Optional, Any
+import math
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Mapping, Optional, Any, Union
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; fall back to the stdlib json handling in requests
+    orjson = None
+
+# Concurrent page requests once the total number of pages is known
+PAGINATION_WORKERS = 8
+
+# Seconds a parent's test run listing is reused before it is fetched again
+TEST_RUNS_CACHE_TTL = 30
+
+# Responses larger than this are decoded with orjson when it is available
+ORJSON_MIN_RESPONSE_BYTES = 4096
+
+# Names per search query when resolving many test case names at once
+SEARCH_NAMES_CHUNK_SIZE = 100
+
+# (connect, read) seconds for API calls; uploads of large step attachments
+# get no read limit, as before timeouts were added
+REQUEST_TIMEOUT = (5, 30)
+UPLOAD_TIMEOUT = (5, None)
+
+# Seconds a test case/cycle name index is trusted; a lookup that misses
+# rebuilds it sooner, so items created elsewhere are found
+NAME_INDEX_TTL = 300
+NAME_INDEX_MISS_TTL = 30
+
+
+def _compact(data: Dict) -> Dict:
+    """Return a copy of a payload without top-level None/empty values"""
+    return {k: v for k, v in data.items() if v is not None and not (isinstance(v, (str, list, dict)) and not v)}
+
+
+# Response helpers shared with QTestAPIAsync so both clients read replies the same way
+
+def _page_items(resp: Any) -> List[Dict]:
+    """Normalize a page of results (a list, or an object with 'items') to a list"""
+    if isinstance(resp, list):
+        return resp
+    if isinstance(resp, dict):
+        return resp.get('items') or []
+    return []
+
+
+def _total_count(headers: Mapping[str, str], resp: Any) -> Optional[int]:
+    """Read the total record count from the response headers or body, if the server sends one"""
+    total = headers.get('X-Total-Count') or headers.get('X-Total')
+    if total is None and isinstance(resp, dict):
+        total = resp.get('total')
+    try:
+        return int(total) if total is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _created_test_logs(data: Any) -> Union[List[Dict], Dict]:
+    """
+    Normalize a successful bulk test-log response: the created logs (a list,
+    or an object with 'items'/'test_logs'), else the task object ({} if empty)
+    """
+    if isinstance(data, list):
+        return data
+    if isinstance(data, dict):
+        for key in ('items', 'test_logs'):
+            if isinstance(data.get(key), list):
+                return data[key]
+        return data
+    return {}
+
+
+class QTestRetry(Retry):
+    """
+    Retry policy that never resends a POST the server may have processed.
+
+    GET/PUT/DELETE are retried on connection errors, read errors and 429/5xx.
+    POST creates test logs, runs and cycles, so it is only retried when the
+    connection could not be made or the server answered 429 (not processed).
+    """
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if method.upper() == 'POST':
+            return bool(self.total) and status_code == 429
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+class KeepAliveHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled sockets use TCP_NODELAY and SO_KEEPALIVE"""
+
+    # urllib3's defaults already set TCP_NODELAY; add keep-alive probes on top
+    SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault('socket_options', self.SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **kwargs)
+
 
 class QTestAPI:
     """QTest API wrapper for making HTTP requests"""
@@ -25,71 +131,169 @@ class QTestAPI:
         self.base_url = base_url.rstrip('/')
         self.api_token = api_token
         self.project_id = project_id
+        # Every endpoint is project-scoped; build the prefix once
+        self._project_url = f"{self.base_url}/api/v3/projects/{self.project_id}"
         # Normalize Authorization header to use Bearer schema (as per qTest examples)
         token = api_token or ""
         if token and not token.lower().startswith("bearer "):
             token = f"Bearer {token}"
         self.headers = {
             'Authorization': token,
-            'Content-Type': 'application/json'
+            'Content-Type': 'application/json',
+            # Large listings compress well; urllib3 decompresses transparently
+            'Accept-Encoding': 'gzip, deflate'
         }
         self.logger = logging.getLogger(__name__)
+        # Reuse TCP/TLS connections across calls; transient failures are retried with backoff
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        # raise_on_status=False hands the last response to raise_for_status(), so
+        # callers see an HTTPError with its status code rather than a RetryError
+        retries = QTestRetry(total=5, backoff_factor=0.25,
+                             status_forcelist=[429, 500, 502, 503, 504],
+                             allowed_methods=["GET", "PUT", "DELETE"],
+                             respect_retry_after_header=True,
+                             raise_on_status=False)
+        adapter = KeepAliveHTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retries)
+        # Mount for both schemes so plain-http (e.g. on-prem or proxied) servers are pooled too
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        # Project metadata rarely changes during a session; fetched once and reused
+        self._metadata_lock = threading.Lock()
+        self._status_cache: Optional[List[Dict]] = None
+        self._field_cache: Optional[List[Dict]] = None
+        # Lower-cased name/pid -> ID indexes, built on first lookup
+        self._index_lock = threading.Lock()
+        self._tc_index: Optional[Dict[str, int]] = None
+        self._cycle_index: Optional[Dict[str, int]] = None
+        # time.monotonic() when each index was built
+        self._tc_index_built = 0.0
+        self._cycle_index_built = 0.0
+        # Serializes get-or-create so concurrent callers do not create duplicate cycles
+        self._cycle_create_lock = threading.Lock()
+        # test_case_id -> {step order: step id}, built on first lookup per test case
+        self._step_index_cache: Dict[int, Dict[Any, int]] = {}
+        # (parent_id, parent_type, page_size) -> (fetched_at, runs, {test case id: run id})
+        self._test_runs_cache: Dict[tuple, tuple] = {}
+        # (endpoint, params) -> (ETag, decoded body) for conditional GETs of metadata endpoints
+        self._etag_cache: Dict[tuple, tuple] = {}
+        # Whether the search endpoint accepts test case queries; None until first probed
+        self._search_supported: Optional[bool] = None
+        # Whether the bulk test-log endpoint is available; None until first probed
+        self._bulk_test_logs_supported: Optional[bool] = None
+        # Whether the batch test-run endpoint is available; None until first probed
+        self._batch_test_runs_supported: Optional[bool] = None
         
+    def close(self):
+        """Close the pooled connections held by the session"""
+        self.session.close()
+
+    def __enter__(self) -> 'QTestAPI':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
     def encode_file(self,filelocation):
         file_rb=open(filelocation, 'rb')
         return file_rb
 
-    def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None, 
-                     params: Optional[Dict] = None, headers: Optional[Dict] = None) -> Optional[Dict]:
+    def _send_request(self, method: str, endpoint: str, data: Optional[Dict] = None,
+                      params: Optional[Dict] = None, headers: Optional[Dict] = None,
+                      compact: bool = False, timeout: Any = REQUEST_TIMEOUT) -> requests.Response:
         """
-        Make HTTP request to QTest API
+        Send an HTTP request to QTest API and return the raw response
         
         Args:
             method: HTTP method (GET, POST, PUT, DELETE)
             endpoint: API endpoint
             data: Request body data
             params: Query parameters
+            headers: Extra headers for this request only (optional)
+            compact: Drop top-level None/empty fields from dict bodies before sending.
+                     Only for create payloads; updates send ''/None/[] to clear a field
+            timeout: requests timeout, (connect, read) seconds
             
         Returns:
-            Response data as dictionary or None
+            The successful requests.Response (raises for HTTP errors)
         """
-        if headers is None:
-            headers = self.headers
-        else:
-            # Merge with default headers
-            merged_headers = self.headers.copy()
-            merged_headers.update(headers)
-            self.headers = merged_headers
-        url = f"{self.base_url}/api/v3/projects/{self.project_id}/{endpoint}"
+        # Default headers live on the session; only per-call overrides are passed
+        # through, and requests merges them with the session headers itself.
+        url = f"{self._project_url}/{endpoint}"
         
         try:
-            self.logger.debug(f"Making {method} request to {url}")
+            self.logger.debug("Making %s request to %s", method, url)
             
-            if method.upper() == 'GET':
-                response = requests.get(url, headers=self.headers, params=params)
-            elif method.upper() == 'POST':
-                try:
-                    response = requests.post(url, headers=self.headers, json=data, params=params)
-                except Exception as e:
-                    response = requests.post(url, headers=self.headers, data=data, params=params)
-            elif method.upper() == 'PUT':
-                response = requests.put(url, headers=self.headers, json=data, params=params)
-            elif method.upper() == 'DELETE':
-                response = requests.delete(url, headers=self.headers, params=params)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
+            if compact and isinstance(data, dict):
+                data = _compact(data)
+            # Dicts/lists are sent as JSON; anything else (e.g. attachment file streams) as the raw body
+            json_body = data if isinstance(data, (dict, list)) else None
+            raw_body = data if json_body is None else None
+            if json_body is not None and orjson is not None:
+                # Content-Type is already application/json on the session
+                raw_body = orjson.dumps(json_body)
+                json_body = None
+            response = self.session.request(method, url, headers=headers, json=json_body, data=raw_body,
+                                            params=params, timeout=timeout)
             
             response.raise_for_status()
-            
-            if response.content:
-                return response.json()
-            return None
+            return response
             
         except requests.exceptions.RequestException as e:
             self.logger.error(f"API request failed: {str(e)}")
             if hasattr(e.response, 'text'):
                 self.logger.error(f"Response: {e.response.text}")
             raise
+
+    @staticmethod
+    def _decode_response(response: requests.Response) -> Optional[Any]:
+        """Decode a JSON response body; returns None for empty bodies"""
+        if response.content:
+            if orjson is not None and len(response.content) > ORJSON_MIN_RESPONSE_BYTES:
+                return orjson.loads(response.content)
+            return response.json()
+        return None
+
+    def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None, 
+                     params: Optional[Dict] = None, headers: Optional[Dict] = None,
+                     conditional: bool = False, compact: bool = False,
+                     timeout: Any = REQUEST_TIMEOUT) -> Optional[Dict]:
+        """
+        Make HTTP request to QTest API
+        
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint
+            data: Request body data
+            params: Query parameters
+            headers: Extra headers for this request only (optional)
+            conditional: For GETs, send If-None-Match with the last ETag seen for this
+                         endpoint and reuse the cached body on 304 Not Modified
+            compact: Drop top-level None/empty fields from dict bodies before sending.
+                     Only for create payloads; updates send ''/None/[] to clear a field
+            timeout: requests timeout, (connect, read) seconds
+            
+        Returns:
+            Response data as dictionary or None
+        """
+        if conditional and method == 'GET':
+            return self._conditional_get(endpoint, params)
+        return self._decode_response(self._send_request(method, endpoint, data=data, params=params,
+                                                        headers=headers, compact=compact, timeout=timeout))
+
+    def _conditional_get(self, endpoint: str, params: Optional[Dict] = None) -> Optional[Any]:
+        """GET using the cached ETag; returns the cached body when the server answers 304"""
+        key = (endpoint, tuple(sorted((params or {}).items())))
+        cached = self._etag_cache.get(key)
+        headers = {'If-None-Match': cached[0]} if cached else None
+        response = self._send_request('GET', endpoint, params=params, headers=headers)
+        if response.status_code == 304 and cached:
+            return cached[1]
+        body = self._decode_response(response)
+        etag = response.headers.get('ETag')
+        if etag:
+            self._etag_cache[key] = (etag, body)
+        return body
     
     def get_test_case(self, test_case_id: int) -> Dict:
         """Get test case details"""
@@ -112,7 +316,8 @@ class QTestAPI:
         params = None
         if parent_id and parent_type:
             params = { 'parentId': parent_id, 'parentType': parent_type }
-        return self._make_request('POST', 'test-runs', data=test_run_data, params=params)
+            self.invalidate_test_runs_cache(parent_id, parent_type)
+        return self._make_request('POST', 'test-runs', data=test_run_data, params=params, compact=True)
     
     def update_test_run(self, test_run_id: int, test_run_data: Dict) -> Dict:
         """Update existing test run"""
@@ -129,8 +334,69 @@ class QTestAPI:
         Returns:
             Created test log details
         """
-        return self._make_request('POST', f'test-runs/{test_run_id}/test-logs', data=test_log_data)
-    
+        return self._make_request('POST', f'test-runs/{test_run_id}/test-logs', data=test_log_data, compact=True)
+
+    def bulk_add_test_logs(self, test_run_id: int, logs: List[Dict]) -> Optional[Union[List[Dict], Dict]]:
+        """
+        Add several test logs to a test run in a single request.
+
+        Endpoint: POST /api/v3/projects/{projectId}/test-runs/{testRunId}/auto-test-logs
+
+        Args:
+            test_run_id: Test run ID
+            logs: List of test log payloads (same shape as add_test_log)
+
+        Returns:
+            List of created test log details; or the queued task object when the
+            server accepts the logs for asynchronous processing (a 2xx reply
+            without a list of logs); or None when the logs must be posted one by
+            one: the bulk endpoint is missing (HTTP 404/405, cached so later calls
+            skip the round-trip) or rejected this batch (HTTP 400).
+        """
+        if self._bulk_test_logs_supported is False:
+            return None
+        logs = [_compact(log) for log in logs]
+        if orjson is not None:
+            # Encode each log once and splice them into the envelope as raw JSON bytes
+            body = b'{"test_logs":[' + b','.join(orjson.dumps(log) for log in logs) + b']}'
+        else:
+            body = {'test_logs': logs}
+        try:
+            data = self._make_request('POST', f'test-runs/{test_run_id}/auto-test-logs', data=body)
+        except requests.exceptions.HTTPError as e:
+            status_code = getattr(e.response, 'status_code', None)
+            if status_code in (404, 405):
+                self.logger.warning(f"Bulk test log endpoint unavailable (HTTP {status_code}); "
+                                    f"falling back to per-log requests")
+                self._bulk_test_logs_supported = False
+                return None
+            if status_code == 400:
+                # One malformed log rejects the whole batch; let each log succeed or fail alone
+                self.logger.warning("Bulk test log request rejected (HTTP 400); "
+                                    "falling back to per-log requests for this batch")
+                return None
+            raise
+        self._bulk_test_logs_supported = True
+        return _created_test_logs(data)
+
+    def submit_auto_test_logs(self, test_cycle_id: int, logs: List[Dict]) -> Union[List[Dict], Dict]:
+        """
+        Submit test logs for many test cases under a test cycle in a single request.
+
+        Endpoint: POST /api/v3/projects/{projectId}/test-cycles/{testCycleId}/auto-test-logs
+
+        Args:
+            test_cycle_id: Test cycle ID
+            logs: Test log payloads, each with a 'test_case': {'id': ...} reference
+
+        Returns:
+            List of created test log details, or the queued task object when the
+            server processes the logs asynchronously
+        """
+        body = {'test_logs': [_compact(log) for log in logs]}
+        data = self._make_request('POST', f'test-cycles/{test_cycle_id}/auto-test-logs', data=body)
+        return _created_test_logs(data)
+
     def update_test_log(self, test_log_id: int, test_log_data: Dict) -> Dict:
         """Update existing test log"""
         return self._make_request('PUT', f'test-logs/{test_log_id}', data=test_log_data)
@@ -160,43 +426,99 @@ class QTestAPI:
             return data
         return []
 
+    @staticmethod
+    def _step_order_key(order: Any) -> Any:
+        """Canonical index key for a step order: an int when possible, else the stripped string"""
+        try:
+            return int(order)
+        except (TypeError, ValueError):
+            return str(order).strip()
+
     def find_test_step_id_by_order(self, test_case_id: int, step_number: int) -> Optional[int]:
         """
         Find a test step ID by its order/index within the test case.
         Tries common keys: order, index, sequence, position.
+        The test case's steps are fetched and indexed once; later lookups are dict hits.
         """
-        steps = self.get_test_steps(test_case_id) or []
-        for s in steps:
-            order = s.get('order') or s.get('index') or s.get('sequence') or s.get('position')
-            if order is None:
-                continue
-            try:
-                if int(order) == int(step_number):
-                    return s.get('id')
-            except Exception:
-                # fallback to string equality
-                if str(order).strip() == str(step_number).strip():
-                    return s.get('id')
-        return None
+        index = self._step_index_cache.get(test_case_id)
+        if index is None:
+            index = {}
+            for s in self.get_test_steps(test_case_id) or []:
+                order = next((s.get(k) for k in ('order', 'index', 'sequence', 'position')
+                              if s.get(k) is not None), None)
+                if order is None:
+                    continue
+                index.setdefault(self._step_order_key(order), s.get('id'))
+            self._step_index_cache[test_case_id] = index
+        return index.get(self._step_order_key(step_number))
+
+    def invalidate_step_index(self, test_case_id: Optional[int] = None):
+        """Drop the cached step index for one test case, or for all test cases"""
+        if test_case_id is None:
+            self._step_index_cache.clear()
+        else:
+            self._step_index_cache.pop(test_case_id, None)
     
     def get_field_settings(self) -> List[Dict]:
-        """Get project field settings"""
-        return self._make_request('GET', 'settings/test-runs/fields')
+        """Get project field settings (cached until invalidate_metadata_cache is called)"""
+        with self._metadata_lock:
+            if self._field_cache is None:
+                self._field_cache = self._make_request('GET', 'settings/test-runs/fields', conditional=True)
+            return self._field_cache
     
     def get_execution_statuses(self) -> List[Dict]:
-        """Get available execution statuses"""
-        return self._make_request('GET', 'test-runs/execution-statuses')
+        """Get available execution statuses (cached until invalidate_metadata_cache is called)"""
+        with self._metadata_lock:
+            if self._status_cache is None:
+                self._status_cache = self._make_request('GET', 'test-runs/execution-statuses', conditional=True)
+            return self._status_cache
+
+    def invalidate_metadata_cache(self):
+        """Drop cached execution statuses and field settings so the next call refetches them"""
+        with self._metadata_lock:
+            self._status_cache = None
+            self._field_cache = None
     
     def get_test_cycles(self) -> List[Dict]:
-        """Get all test cycles in the project"""
-        return self._make_request('GET', 'test-cycles')
+        """Get all test cycles in the project (revalidated with If-None-Match)"""
+        return self._make_request('GET', 'test-cycles', conditional=True)
     
     def create_test_cycle(self, test_cycle_data: Dict, parent_id: Optional[int] = None, parent_type: Optional[str] = None) -> Dict:
         """Create a new test cycle; optionally under a parent via query params."""
         params = None
         if parent_id and parent_type:
             params = { 'parentId': parent_id, 'parentType': parent_type }
-        return self._make_request('POST', 'test-cycles', data=test_cycle_data, params=params)
+        created = self._make_request('POST', 'test-cycles', data=test_cycle_data, params=params, compact=True)
+        # Keep an already built name index in sync so lookups see the new cycle
+        with self._index_lock:
+            if self._cycle_index is not None and created:
+                for key in (created.get('name'), created.get('pid')):
+                    if key:
+                        self._cycle_index.setdefault(str(key).strip().lower(), created.get('id'))
+        return created
+
+    def get_or_create_test_cycle_id(self, name: str, description: Optional[str] = None) -> Optional[int]:
+        """
+        Return the ID of the test cycle with this name, creating it if missing.
+
+        qTest has no upsert endpoint, so this resolves the name from the cycle
+        index and only POSTs when it is absent. Before creating, the index is
+        rebuilt (a conditional GET) so a cycle created outside this process is
+        found rather than duplicated. Calls are serialized so parallel callers
+        cannot create the same cycle twice.
+        """
+        with self._cycle_create_lock:
+            cycle_id = self.find_test_cycle_id_by_name(name)
+            if cycle_id is None:
+                cycle_id = self.find_test_cycle_id_by_name(name, refresh=True)
+            if cycle_id is not None:
+                return cycle_id
+            self.logger.info("Test cycle '%s' not found. Creating new test cycle.", name)
+            test_cycle_data = {'name': name}
+            if description:
+                test_cycle_data['description'] = description
+            created = self.create_test_cycle(test_cycle_data)
+            return created.get('id') if created else None
 
     # ------- Additional helpers aligned with reference implementation -------
     def get_test_cycles_under(self, parent_cycle_id: int) -> List[Dict]:
@@ -209,29 +531,53 @@ class QTestAPI:
 
     def create_test_suite_under_cycle(self, parent_cycle_id: int, suite_data: Dict) -> Dict:
         """Create a new test suite under a given test cycle."""
-        return self._make_request('POST', 'test-suites', data=suite_data, params={ 'parentId': parent_cycle_id, 'parentType': 'test-cycle' })
+        return self._make_request('POST', 'test-suites', data=suite_data,
+                                  params={ 'parentId': parent_cycle_id, 'parentType': 'test-cycle' }, compact=True)
 
-    def get_test_runs(self, parent_id: int, parent_type: str, page_size: int = 1000) -> List[Dict]:
-        """Get test runs under a given parent (test-suite, test-cycle, release)."""
+    def _cached_test_runs(self, parent_id: int, parent_type: str, page_size: int = 1000) -> tuple:
+        """
+        Return (runs, {test case id: run id}) for a parent, reusing a listing
+        fetched within the last TEST_RUNS_CACHE_TTL seconds.
+        """
+        key = (parent_id, parent_type, page_size)
+        cached = self._test_runs_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < TEST_RUNS_CACHE_TTL:
+            return cached[1], cached[2]
         data = self._make_request('GET', 'test-runs', params={
             'parentId': parent_id,
             'parentType': parent_type,
             'pageSize': page_size
         })
-        if isinstance(data, dict) and 'items' in data:
-            return data.get('items', [])
-        if isinstance(data, list):
-            return data
-        return []
+        runs = _page_items(data)
+        run_ids: Dict[int, int] = {}
+        for r in runs:
+            try:
+                tc_id = int((r.get('test_case') or {}).get('id'))
+            except (TypeError, ValueError):
+                continue
+            run_ids.setdefault(tc_id, r.get('id'))
+        self._test_runs_cache[key] = (time.monotonic(), runs, run_ids)
+        return runs, run_ids
+
+    def invalidate_test_runs_cache(self, parent_id: Optional[int] = None, parent_type: Optional[str] = None):
+        """Drop cached test run listings for one parent, or for all parents"""
+        if parent_id is None:
+            self._test_runs_cache.clear()
+            return
+        for key in [k for k in self._test_runs_cache if k[0] == parent_id and (parent_type is None or k[1] == parent_type)]:
+            self._test_runs_cache.pop(key, None)
+
+    def get_test_runs(self, parent_id: int, parent_type: str, page_size: int = 1000) -> List[Dict]:
+        """Get test runs under a given parent (test-suite, test-cycle, release); cached briefly per parent."""
+        return self._cached_test_runs(parent_id, parent_type, page_size)[0]
 
     def find_test_run_id_by_test_case(self, parent_id: int, parent_type: str, test_case_id: int) -> Optional[int]:
         """Find an existing test run ID for a given test case under the specified parent."""
-        runs = self.get_test_runs(parent_id, parent_type) or []
-        for r in runs:
-            tc = r.get('test_case') or {}
-            if str(tc.get('id')) == str(test_case_id):
-                return r.get('id')
-        return None
+        try:
+            target = int(test_case_id)
+        except (TypeError, ValueError):
+            return None
+        return self._cached_test_runs(parent_id, parent_type)[1].get(target)
 
     def create_test_run_for_case(self, parent_id: int, parent_type: str, test_case_id: int,
                                  name: Optional[str] = None,
@@ -239,83 +585,297 @@ class QTestAPI:
                                  exe_end_date: Optional[str] = None) -> Dict:
         """
         Create a single test run for a specific test case under a parent container (e.g., test-suite).
-        Name defaults to the test case name if not provided.
+        Name defaults to the test case name if not provided (fetched with one extra request).
         """
-        tc = self.get_test_case(test_case_id)
+        if not name:
+            tc = self.get_test_case(test_case_id) or {}
+            name = tc.get('name', f'Test Run for {test_case_id}')
         payload: Dict[str, Any] = {
-            'name': name or tc.get('name', f'Test Run for {test_case_id}'),
+            'name': name,
             'test_case': {'id': test_case_id}
         }
         if exe_start_date:
             payload['exe_start_date'] = exe_start_date
         if exe_end_date:
             payload['exe_end_date'] = exe_end_date
-        return self._make_request('POST', 'test-runs', data=payload, params={ 'parentId': parent_id, 'parentType': parent_type })
+        self.invalidate_test_runs_cache(parent_id, parent_type)
+        return self._make_request('POST', 'test-runs', data=payload,
+                                  params={ 'parentId': parent_id, 'parentType': parent_type }, compact=True)
+
+    def batch_create_test_runs(self, parent_id: int, parent_type: str, runs: List[Dict]) -> Optional[List[Dict]]:
+        """
+        Create several test runs under a parent container in a single request.
+
+        Endpoint: POST /api/v3/projects/{projectId}/test-runs/batch?parentId=..&parentType=..
+
+        Args:
+            parent_id: ID of the parent container (e.g., test-suite or test-cycle)
+            parent_type: Parent type string (e.g., 'test-suite', 'test-cycle')
+            runs: List of test run payloads (same shape as create_test_run)
+
+        Returns:
+            List of created test runs, or None if the server rejects the batch
+            endpoint (HTTP 404/405). The result is cached so later calls return
+            None without another round-trip.
+        """
+        if self._batch_test_runs_supported is False:
+            return None
+        self.invalidate_test_runs_cache(parent_id, parent_type)
+        try:
+            data = self._make_request('POST', 'test-runs/batch', data={'items': runs},
+                                      params={'parentId': parent_id, 'parentType': parent_type})
+        except requests.exceptions.HTTPError as e:
+            status_code = getattr(e.response, 'status_code', None)
+            if status_code in (404, 405):
+                self.logger.warning(f"Batch test run endpoint unavailable (HTTP {status_code}); "
+                                    f"falling back to per-run requests")
+                self._batch_test_runs_supported = False
+                return None
+            raise
+        self._batch_test_runs_supported = True
+        return _page_items(data)
 
     # -------- Name-based lookup helpers --------
     def list_test_cases(self, page_size: int = 100) -> List[Dict]:
         """
         List all test cases in the project with simple pagination.
-        Note: Depending on project size, consider narrowing via name matching after fetching pages.
+        When the first page reports the total count, the remaining pages are
+        fetched concurrently; otherwise pages are requested until one is empty.
         """
-        all_cases: List[Dict] = []
-        page = 1
+        params = {'page': 1, 'size': page_size}
+        response = self._send_request('GET', 'test-cases', params=params)
+        resp = self._decode_response(response)
+        items = _page_items(resp)
+        if not items:
+            return []
+        all_cases: List[Dict] = list(items)
+
+        def fetch_page(page: int) -> List[Dict]:
+            return _page_items(self._make_request('GET', 'test-cases', params={'page': page, 'size': page_size}))
+
+        total = _total_count(response.headers, resp)
+        if total is not None:
+            num_pages = math.ceil(total / page_size)
+            if num_pages > 1:
+                with ThreadPoolExecutor(max_workers=PAGINATION_WORKERS) as executor:
+                    for page_items in executor.map(fetch_page, range(2, num_pages + 1)):
+                        all_cases.extend(page_items)
+            return all_cases
+
+        page = 2
         while True:
-            resp = self._make_request('GET', 'test-cases', params={'page': page, 'size': page_size})
-            if not resp:
+            items = fetch_page(page)
+            if not items:
                 break
-            if isinstance(resp, list):
-                if len(resp) == 0:
-                    break
-                all_cases.extend(resp)
-            else:
-                # Some deployments may return an object with 'items'
-                items = resp.get('items') if isinstance(resp, dict) else None
-                if not items:
-                    break
-                all_cases.extend(items)
-                # If a total/pages is present, we could iterate accordingly; here we fall back to length check.
-                if len(items) == 0:
-                    break
+            all_cases.extend(items)
             page += 1
         return all_cases
 
+    @staticmethod
+    def _index_is_stale(built_at: float, complete: bool) -> bool:
+        """Whether a name index built at built_at must be rebuilt (complete: it had every wanted name)"""
+        age = time.monotonic() - built_at
+        return age > NAME_INDEX_TTL or (not complete and age > NAME_INDEX_MISS_TTL)
+
+    def _test_case_index(self, targets) -> Dict[str, int]:
+        """The test case name index (call with _index_lock held), rebuilt when stale for targets"""
+        index = self._tc_index
+        if index is None or self._index_is_stale(self._tc_index_built, all(t in index for t in targets)):
+            index = self._build_name_index(
+                self.list_test_cases(),
+                lambda c: c.get('id') or c.get('test_case_version_id')
+            )
+            self._tc_index, self._tc_index_built = index, time.monotonic()
+        return index
+
+    @staticmethod
+    def _build_name_index(items: List[Dict], id_getter) -> Dict[str, int]:
+        """
+        Build a {lower-cased name or pid: id} index. The first item wins for
+        duplicate keys, matching the previous first-match linear scan.
+        """
+        index: Dict[str, int] = {}
+        for item in items:
+            item_id = id_getter(item)
+            item_name = str(item.get('name', '')).strip().lower()
+            item_pid = str(item.get('pid', '')).strip().lower()
+            index.setdefault(item_name, item_id)
+            if item_pid:
+                index.setdefault(item_pid, item_id)
+        return index
+
+    @staticmethod
+    def _quote_search_value(value: str) -> str:
+        """Quote a value for a qTest search query"""
+        return "'" + value.replace("'", "\\'") + "'"
+
+    def _search_test_cases(self, query: str, size: Optional[int] = None) -> Optional[List[Dict]]:
+        """
+        Run a test case search query.
+
+        Endpoint: POST /api/v3/projects/{projectId}/search
+
+        Returns the matching test cases, or None if the server rejects the
+        search request (HTTP 400/404). The result is cached so later calls
+        return None without another round-trip. With a page size, the pages
+        are fetched until the result set (or reported total) is exhausted.
+        """
+        if self._search_supported is False:
+            return None
+        payload = {
+            'object_type': 'test-cases',
+            'fields': ['id', 'name', 'pid'],
+            'query': query
+        }
+        results: List[Dict] = []
+        page = 1
+        while True:
+            params = {'page': page, 'size': size} if size else None
+            try:
+                data = self._make_request('POST', 'search', data=payload, params=params)
+            except requests.exceptions.HTTPError as e:
+                status_code = getattr(e.response, 'status_code', None)
+                if status_code in (400, 404) and page == 1:
+                    self.logger.warning(f"Test case search unavailable (HTTP {status_code}); "
+                                        f"falling back to listing all test cases")
+                    self._search_supported = False
+                    return None
+                raise
+            self._search_supported = True
+            if isinstance(data, dict):
+                items = data.get('items') or []
+                total = data.get('total')
+            else:
+                items = data if isinstance(data, list) else []
+                total = None
+            results.extend(items)
+            if not size or len(items) < size or (total is not None and len(results) >= int(total)):
+                return results
+            page += 1
+
+    def search_test_cases_by_name(self, name: str) -> Optional[List[Dict]]:
+        """
+        Search test cases whose name or pid equals the given value.
+        Returns None if the search endpoint is unavailable.
+        """
+        value = self._quote_search_value(name)
+        return self._search_test_cases(f"'Name' = {value} OR 'Id' = {value}")
+
     def find_test_case_id_by_name(self, name: str) -> Optional[int]:
         """
         Find a test case ID by its display name or pid (case-insensitive exact match).
         Returns the first matching ID or None if not found.
+        Uses the search endpoint when available. The server may compare names
+        case-sensitively, so on a search miss (or without search) the project's
+        test cases are indexed; the index is rebuilt after NAME_INDEX_TTL seconds
+        (NAME_INDEX_MISS_TTL when the name is missing). Use
+        invalidate_name_indexes() to pick up newly created cases at once.
         """
         try:
-            cases = self.list_test_cases()
             target = name.strip().lower()
-            for c in cases:
-                case_name = str(c.get('name', '')).strip().lower()
-                case_pid = str(c.get('pid', '')).strip().lower()
-                if case_name == target or (case_pid and case_pid == target):
-                    return c.get('id') or c.get('test_case_version_id')
-            return None
+            if self._tc_index is None:
+                matches = self.search_test_cases_by_name(name.strip())
+                if matches is not None:
+                    case_id = self._build_name_index(
+                        matches,
+                        lambda c: c.get('id') or c.get('test_case_version_id')
+                    ).get(target)
+                    if case_id is not None:
+                        return case_id
+            with self._index_lock:
+                return self._test_case_index((target,)).get(target)
         except Exception as e:
             self.logger.error(f"Failed to find test case by name '{name}': {e}")
             return None
 
-    def find_test_cycle_id_by_name(self, name: str) -> Optional[int]:
+    def find_test_case_ids_by_names(self, names: List[str]) -> Dict[str, int]:
+        """
+        Resolve many test case names (or pids) to IDs with as few requests as possible.
+
+        Names are searched with 'Name' IN (...) queries of up to
+        SEARCH_NAMES_CHUNK_SIZE names, issued concurrently; every spelling
+        passed in is sent. Matching ignores case, so names the search misses (a
+        server may compare them case-sensitively), or all names when the search
+        endpoint is unavailable, are looked up in the project's test case index.
+
+        Returns:
+            {name: id} for every given name that was found (keys as passed in)
+
+        Raises:
+            requests.exceptions.RequestException: If a search or listing request fails
+        """
+        wanted: Dict[str, List[str]] = {}
+        for name in names:
+            target = str(name).strip().lower()
+            if target:
+                wanted.setdefault(target, []).append(name)
+        if not wanted:
+            return {}
+
+        def id_of(case: Dict) -> Optional[int]:
+            return case.get('id') or case.get('test_case_version_id')
+
+        index: Optional[Dict[str, int]] = None
+        if self._tc_index is None:
+            targets = list(wanted)
+            chunks = [targets[i:i + SEARCH_NAMES_CHUNK_SIZE]
+                      for i in range(0, len(targets), SEARCH_NAMES_CHUNK_SIZE)]
+
+            def search_chunk(chunk: List[str]) -> Optional[List[Dict]]:
+                originals = list(dict.fromkeys(n.strip() for t in chunk for n in wanted[t]))
+                values = ", ".join(self._quote_search_value(v) for v in originals)
+                return self._search_test_cases(f"'Name' IN ({values}) OR 'Id' IN ({values})",
+                                               size=2 * len(originals))
+
+            # Probe with the first chunk so an unsupported search is detected once
+            first = search_chunk(chunks[0])
+            if first is not None:
+                matches = list(first)
+                if len(chunks) > 1:
+                    with ThreadPoolExecutor(max_workers=PAGINATION_WORKERS) as executor:
+                        for chunk_matches in executor.map(search_chunk, chunks[1:]):
+                            matches.extend(chunk_matches or [])
+                index = self._build_name_index(matches, id_of)
+        if index is None or any(t not in index for t in wanted):
+            with self._index_lock:
+                listed = self._test_case_index(wanted)
+            index = listed if index is None else {**listed, **index}
+
+        found: Dict[str, int] = {}
+        for target, originals in wanted.items():
+            case_id = index.get(target)
+            if case_id:
+                for name in originals:
+                    found[name] = case_id
+        return found
+
+    def find_test_cycle_id_by_name(self, name: str, refresh: bool = False) -> Optional[int]:
         """
         Find a test cycle ID by its name or pid (case-insensitive exact match).
         Returns the first matching ID or None if not found.
+        The project's test cycles are indexed and the index is rebuilt after
+        NAME_INDEX_TTL seconds (NAME_INDEX_MISS_TTL when the name is missing),
+        or right away with refresh=True.
         """
         try:
-            cycles = self.get_test_cycles() or []
             target = name.strip().lower()
-            for cy in cycles:
-                cy_name = str(cy.get('name', '')).strip().lower()
-                cy_pid = str(cy.get('pid', '')).strip().lower()
-                if cy_name == target or (cy_pid and cy_pid == target):
-                    return cy.get('id')
-            return None
+            with self._index_lock:
+                index = self._cycle_index
+                if (refresh or index is None
+                        or self._index_is_stale(self._cycle_index_built, target in index)):
+                    index = self._build_name_index(self.get_test_cycles() or [], lambda cy: cy.get('id'))
+                    self._cycle_index, self._cycle_index_built = index, time.monotonic()
+                return index.get(target)
         except Exception as e:
             self.logger.error(f"Failed to find test cycle by name '{name}': {e}")
             return None
 
+    def invalidate_name_indexes(self):
+        """Drop the test case and test cycle name indexes so the next lookup rebuilds them"""
+        with self._index_lock:
+            self._tc_index = None
+            self._cycle_index = None
+
     def create_attachment(self, testlogid,fileDict) -> Dict:
         
         # """
@@ -343,4 +903,5 @@ class QTestAPI:
             
             encodedFileContents=self.encode_file(filename)
             endpoint='test-logs/' + str(testlogid) + '/blob-handles'
-            self._make_request('POST', endpoint, data=encodedFileContents, headers=headers)
+            self._make_request('POST', endpoint, data=encodedFileContents, headers=headers,
+                               timeout=UPLOAD_TIMEOUT)
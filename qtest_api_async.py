@@ -0,0 +1,211 @@
+"""
+QTest Async API Wrapper
+Asynchronous counterpart of QTestAPI for fanning out many independent requests
+"""
+
+import asyncio
+import importlib.util
+import logging
+import math
+from typing import Any, Dict, List, Optional, Union
+
+from qtest_api import _compact, _created_test_logs, _page_items, _total_count
+
+try:
+    import httpx
+except ImportError:
+    # httpx is optional; only needed when the async client is used
+    httpx = None
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; httpx encodes bodies with the stdlib json module
+    orjson = None
+
+# HTTP/2 multiplexing needs the optional 'h2' package (pip install httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
+
+class QTestAPIAsync:
+    """
+    Async QTest API client built on httpx.AsyncClient.
+
+    Use as an async context manager so the connection pool is closed:
+
+        async with QTestAPIAsync(base_url, api_token, project_id) as api:
+            await api.bulk_add_test_logs(run_id, logs)
+    """
+
+    def __init__(self, base_url: str, api_token: str, project_id: int,
+                 max_connections: int = 32, transport: Optional[Any] = None):
+        """
+        Initialize async QTest API client
+
+        Args:
+            base_url: QTest base URL (e.g., https://your-domain.qtestnet.com)
+            api_token: QTest API token
+            project_id: QTest project ID
+            max_connections: Maximum concurrent connections in the pool
+            transport: Optional httpx transport (e.g. httpx.MockTransport in tests)
+        """
+        if httpx is None:
+            raise ImportError("httpx is required for QTestAPIAsync. Run: pip install httpx[http2]")
+        self.base_url = base_url.rstrip('/')
+        self.project_id = project_id
+        self._project_url = f"{self.base_url}/api/v3/projects/{self.project_id}"
+        # Normalize Authorization header to use Bearer schema (as per qTest examples)
+        token = api_token or ""
+        if token and not token.lower().startswith("bearer "):
+            token = f"Bearer {token}"
+        self.headers = {
+            'Authorization': token,
+            'Content-Type': 'application/json'
+        }
+        self.max_connections = max_connections
+        self.transport = transport
+        self.logger = logging.getLogger(__name__)
+        self._client = None
+        # Caps in-flight requests at the pool size so gathered requests queue here
+        # instead of timing out (httpx.PoolTimeout) while waiting for a connection
+        self._request_slots: Optional[asyncio.Semaphore] = None
+        # Whether the bulk test-log endpoint is available; None until first probed
+        self._bulk_test_logs_supported: Optional[bool] = None
+
+    async def __aenter__(self) -> 'QTestAPIAsync':
+        self._request_slots = asyncio.Semaphore(self.max_connections)
+        self._client = httpx.AsyncClient(
+            headers=self.headers,
+            http2=HTTP2_AVAILABLE and self.transport is None,
+            limits=httpx.Limits(max_connections=self.max_connections,
+                                max_keepalive_connections=self.max_connections),
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            transport=self.transport
+        )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        """Close the underlying connection pool"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _send_request(self, method: str, endpoint: str, data: Optional[Any] = None,
+                            params: Optional[Dict] = None) -> 'httpx.Response':
+        """Send an HTTP request and return the raw response (raises for HTTP errors)"""
+        if self._client is None:
+            raise RuntimeError("QTestAPIAsync must be used inside 'async with'")
+        url = f"{self._project_url}/{endpoint}"
+        self.logger.debug("Making %s request to %s", method, url)
+        try:
+            async with self._request_slots:
+                if data is not None and orjson is not None:
+                    # Content-Type is already application/json on the client
+                    response = await self._client.request(method, url, content=orjson.dumps(data), params=params)
+                else:
+                    response = await self._client.request(method, url, json=data, params=params)
+            response.raise_for_status()
+            return response
+        except httpx.HTTPError as e:
+            self.logger.error(f"API request failed: {str(e)}")
+            if isinstance(e, httpx.HTTPStatusError):
+                self.logger.error(f"Response: {e.response.text}")
+            raise
+
+    async def _make_request(self, method: str, endpoint: str, data: Optional[Any] = None,
+                            params: Optional[Dict] = None) -> Optional[Any]:
+        """Make HTTP request to QTest API and return the decoded JSON body or None"""
+        response = await self._send_request(method, endpoint, data=data, params=params)
+        if response.content:
+            return response.json()
+        return None
+
+    async def add_test_log(self, test_run_id: int, test_log_data: Dict) -> Dict:
+        """Add test log (execution result) to a test run"""
+        return await self._make_request('POST', f'test-runs/{test_run_id}/test-logs', data=_compact(test_log_data))
+
+    async def bulk_add_test_logs(self, test_run_id: int, logs: List[Dict]) -> Union[List[Any], Dict]:
+        """
+        Add several test logs to a test run.
+
+        Uses the bulk auto-test-logs endpoint when the server supports it;
+        otherwise (or when the server rejects the batch with HTTP 400) every log
+        is posted concurrently with asyncio.gather, at most max_connections at a time.
+        Empty top-level fields are dropped from each log, as QTestAPI does.
+
+        Returns:
+            The created test logs from the bulk endpoint, or its queued task object
+            when it returns no list of logs; on the per-log path one entry per log:
+            the created test log, or the exception raised for it
+        """
+        logs = [_compact(log) for log in logs]
+        if self._bulk_test_logs_supported is not False:
+            try:
+                data = await self._make_request('POST', f'test-runs/{test_run_id}/auto-test-logs',
+                                                data={'test_logs': logs})
+                self._bulk_test_logs_supported = True
+                return _created_test_logs(data)
+            except httpx.HTTPStatusError as e:
+                status_code = e.response.status_code
+                if status_code == 400:
+                    # One malformed log rejects the whole batch; let each log succeed or fail alone
+                    self.logger.warning("Bulk test log request rejected (HTTP 400); "
+                                        "falling back to per-log requests for this batch")
+                elif status_code in (404, 405):
+                    self.logger.warning(f"Bulk test log endpoint unavailable (HTTP {status_code}); "
+                                        f"falling back to per-log requests")
+                    self._bulk_test_logs_supported = False
+                else:
+                    raise
+        return await asyncio.gather(
+            *(self.add_test_log(test_run_id, log) for log in logs),
+            return_exceptions=True
+        )
+
+    async def list_test_cases(self, page_size: int = 100) -> List[Dict]:
+        """
+        List all test cases in the project.
+        When the first page reports the total count, the remaining pages are
+        fetched concurrently; otherwise pages are requested until one is empty.
+        """
+        response = await self._send_request('GET', 'test-cases', params={'page': 1, 'size': page_size})
+        resp = response.json() if response.content else None
+        all_cases = list(_page_items(resp))
+        if not all_cases:
+            return []
+
+        async def fetch_page(page: int) -> List[Dict]:
+            return _page_items(await self._make_request('GET', 'test-cases',
+                                                             params={'page': page, 'size': page_size}))
+
+        total = _total_count(response.headers, resp)
+        if total is not None:
+            pages = await asyncio.gather(*(fetch_page(p) for p in range(2, math.ceil(total / page_size) + 1)))
+            for page_items in pages:
+                all_cases.extend(page_items)
+            return all_cases
+
+        page = 2
+        while True:
+            items = await fetch_page(page)
+            if not items:
+                break
+            all_cases.extend(items)
+            page += 1
+        return all_cases
+
+
+def bulk_add_test_logs(base_url: str, api_token: str, project_id: int,
+                       test_run_id: int, logs: List[Dict]) -> List[Any]:
+    """
+    Synchronous façade: submit test logs through QTestAPIAsync using asyncio.run.
+    Must not be called from code that is already running an event loop.
+    """
+    async def _run() -> List[Any]:
+        async with QTestAPIAsync(base_url, api_token, project_id) as api:
+            return await api.bulk_add_test_logs(test_run_id, logs)
+
+    return asyncio.run(_run())
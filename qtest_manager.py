@@ -3,11 +3,63 @@ QTest Manager
 High-level manager for QTest operations
 """
 
+import atexit
 import json
 import logging
-from typing import Dict, List, Optional, Union
+import logging.handlers
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, TypedDict, Union
 import os
 from qtest_api import QTestAPI
+from qtest_api_async import QTestAPIAsync
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; the config is read with the stdlib json module
+    orjson = None
+
+# Default concurrent requests used when test logs have to be posted one by one
+BULK_FALLBACK_WORKERS = 16
+
+# Seconds a resolved name/step -> ID lookup is reused; misses expire sooner
+# so items created elsewhere are picked up
+LOOKUP_CACHE_TTL = 300
+LOOKUP_CACHE_MISS_TTL = 30
+
+# Log records buffered before they are written to qtest_automation.log
+LOG_BUFFER_CAPACITY = 64
+
+# Hard-coded Build Version custom field sent when no build_version is given.
+# Shared by every payload; never mutate it.
+DEFAULT_BUILD_VERSION_PROPERTY = {
+    'field_id': 12625659,
+    'field_name': 'Build Version',
+    'field_value': '[3643503]',
+    'field_value_name': '[New Value]'
+}
+
+
+class QTestLogPayload(TypedDict, total=False):
+    """
+    Test log body built by _build_test_log_data. 'status' and
+    'test_case_version_id' are always present; the other keys are added only
+    when the result provides a value.
+    """
+    status: Dict
+    test_case_version_id: int
+    note: str
+    exe_time: int
+    defects: List[Dict]
+    exe_start_date: str
+    exe_end_date: str
+    test_step_logs: List[Dict]
+
+
+# Parsed config files shared by all managers: absolute path -> ((mtime_ns, size), config)
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], Dict]] = {}
 
 
 class QTestManager:
@@ -16,12 +68,12 @@ class QTestManager:
         Get a test cycle ID by name, or create it if it does not exist.
         Returns the test cycle ID.
         """
-        cycle_id = self.get_test_cycle_id_by_name(cycle_name)
-        if cycle_id is not None:
+        key = cycle_name.strip().lower()
+        hit, cycle_id = self._cache_lookup(self._cycle_id_cache, key)
+        if hit and cycle_id is not None:
             return cycle_id
-        self.logger.info(f"Test cycle '{cycle_name}' not found. Creating new test cycle.")
-        created = self.create_test_cycle(name=cycle_name, description=description)
-        return created.get('id')
+        cycle_id = self.api.get_or_create_test_cycle_id(cycle_name, description=description)
+        return self._cache_store(self._cycle_id_cache, key, cycle_id)
     """High-level manager for QTest operations"""
     
     def __init__(self, config_path: str = 'config.json'):
@@ -45,24 +97,116 @@ class QTestManager:
         
         # Cache for execution statuses
         self._execution_statuses = None
+        # Memoized lookups: key -> (ID or None, time stored)
+        self._cycle_id_cache: Dict[str, Tuple[Optional[int], float]] = {}
+        self._case_id_cache: Dict[str, Tuple[Optional[int], float]] = {}
+        self._step_id_by_order_cache: Dict[Tuple[int, int], Tuple[Optional[int], float]] = {}
+        # test_case_id -> ({lower-cased step name/description/action: step id}, time stored)
+        self._step_name_index_cache: Dict[int, Tuple[Dict[str, int], float]] = {}
+        # Ready-made {'id', 'name'} status objects for test log payloads, keyed by upper-case name
+        self._status_payloads: Dict[str, Dict] = {}
+        # Status strings as passed by callers (e.g. 'passed', 'Passed') -> status object
+        self._resolved_statuses: Dict[str, Dict] = {}
+
+    def close(self):
+        """Release the API client's pooled connections"""
+        self.api.close()
+
+    def __enter__(self) -> 'QTestManager':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
     
     def _load_config(self, config_path: str) -> Dict:
-        """Load configuration from JSON file"""
-        with open(config_path, 'r') as f:
-            return json.load(f)
+        """
+        Load configuration from JSON file.
+        The file is parsed once and again only when its modification time or
+        size changes. Each manager gets a shallow copy, so setting a top-level
+        key on one manager's config never reaches another's.
+        """
+        path = os.path.abspath(config_path)
+        st = os.stat(path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = _CONFIG_CACHE.get(path)
+        if cached is None or cached[0] != stamp:
+            with open(path, 'rb') as f:
+                raw = f.read()
+            # json.loads accepts bytes too, so both parsers share one binary read
+            cached = (stamp, orjson.loads(raw) if orjson is not None else json.loads(raw))
+            _CONFIG_CACHE[path] = cached
+        return dict(cached[1])
     
     def _setup_logging(self):
-        """Setup logging configuration"""
+        """
+        Setup logging configuration
+
+        Records are put on a queue by the root logger and written to the log
+        file and console by a background QueueListener, so logging from worker
+        threads never waits on file I/O. File output is buffered in batches of
+        LOG_BUFFER_CAPACITY records and flushed early on WARNING and at exit.
+        As with basicConfig, nothing is changed if the root logger already has
+        handlers.
+        """
+        self._log_listener = None
+        root = logging.getLogger()
+        if root.handlers:
+            return
         log_level = self.config.get('log_level', 'INFO')
-        logging.basicConfig(
-            level=getattr(logging, log_level),
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('qtest_automation.log'),
-                logging.StreamHandler()
-            ]
-        )
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        file_handler = logging.FileHandler('qtest_automation.log', delay=True)
+        console_handler = logging.StreamHandler()
+        for handler in (file_handler, console_handler):
+            handler.setFormatter(formatter)
+        # File writes are batched; warnings, errors (and shutdown) flush the buffer immediately
+        handlers = [
+            logging.handlers.MemoryHandler(LOG_BUFFER_CAPACITY, flushLevel=logging.WARNING, target=file_handler),
+            console_handler
+        ]
+        log_queue = queue.Queue(-1)
+        root.addHandler(logging.handlers.QueueHandler(log_queue))
+        root.setLevel(getattr(logging, log_level))
+        self._log_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        self._log_listener.start()
+        # Flush queued records on interpreter exit
+        atexit.register(self._log_listener.stop)
     
+    def invalidate_caches(self):
+        """
+        Forget memoized name/step lookups, the execution statuses and the API
+        client's metadata (statuses, field settings), name, step and test run
+        indexes, e.g. after test cases were edited in qTest.
+        """
+        for cache in (self._cycle_id_cache, self._case_id_cache,
+                      self._step_id_by_order_cache, self._step_name_index_cache):
+            cache.clear()
+        self._execution_statuses = None
+        self._status_payloads = {}
+        self._resolved_statuses = {}
+        self.api.invalidate_metadata_cache()
+        self.api.invalidate_name_indexes()
+        self.api.invalidate_step_index()
+        self.api.invalidate_test_runs_cache()
+
+    @staticmethod
+    def _cache_lookup(cache: Dict, key: Any) -> Tuple[bool, Any]:
+        """Return (hit, value) for a memoized lookup, honoring the hit/miss TTLs"""
+        entry = cache.get(key)
+        if entry is None:
+            return False, None
+        value, stored_at = entry
+        ttl = LOOKUP_CACHE_TTL if value is not None else LOOKUP_CACHE_MISS_TTL
+        if time.monotonic() - stored_at >= ttl:
+            cache.pop(key, None)
+            return False, None
+        return True, value
+
+    @staticmethod
+    def _cache_store(cache: Dict, key: Any, value: Any) -> Any:
+        """Memoize a lookup result (None is cached as a short-lived miss)"""
+        cache[key] = (value, time.monotonic())
+        return value
+
     def get_execution_statuses(self) -> Dict[str, int]:
         """
         Get execution statuses mapping
@@ -76,6 +220,11 @@ class QTestManager:
                 status['name'].upper(): status['id'] 
                 for status in statuses
             }
+            self._status_payloads = {
+                name: {'id': status_id, 'name': name}
+                for name, status_id in self._execution_statuses.items()
+            }
+            self._resolved_statuses = {}
         return self._execution_statuses
     
     def create_test_run(self, 
@@ -95,7 +244,7 @@ class QTestManager:
         You can specify the parent test cycle by name (test_cycle_name).
         If not provided, the test run is created at the project root.
         """
-        self.logger.info(f"Ensuring test run: {name}")
+        self.logger.info("Ensuring test run: %s", name)
         params_parent_id = None
         params_parent_type = None
         # Prefer explicit ID if provided; else resolve by name
@@ -119,40 +268,91 @@ class QTestManager:
             test_run_data['test_case_ids'] = [int(i) for i in test_case_ids]
         if description:
             test_run_data['description'] = description
+        properties: List[Dict] = []
         if planned_start_date:
-            test_run_data['properties'] = test_run_data.get('properties', [])
-            test_run_data['properties'].append({
+            properties.append({
                 'field_id': 'PlannedStartDate',
                 'field_value': planned_start_date
             })
         if planned_end_date:
-            test_run_data['properties'] = test_run_data.get('properties', [])
-            test_run_data['properties'].append({
+            properties.append({
                 'field_id': 'PlannedEndDate',
                 'field_value': planned_end_date
             })
-        if build_version == None:
+        if build_version is None:
             # Hard-coded Build Version custom field values as requested
-            test_run_data['properties'] = test_run_data.get('properties', [])
-            test_run_data['properties'].append({
-                'field_id': 12625659,
-                'field_name': 'Build Version',
-                'field_value': '[3643503]',
-                'field_value_name': '[New Value]'
-            })
+            properties.append(DEFAULT_BUILD_VERSION_PROPERTY)
+        if properties:
+            test_run_data['properties'] = properties
         try:
             result = self.api.create_test_run(test_run_data, parent_id=params_parent_id, parent_type=params_parent_type)
-            self.logger.info(f"Test run created successfully. ID: {result.get('id')}")
+            self.logger.info("Test run created successfully. ID: %s", result.get('id'))
             return result
         except Exception as e:
             self.logger.error(f"Failed to create test run: {str(e)}")
             raise
     
+    def _status_payload(self, status: str) -> Dict:
+        """
+        Return the {'id', 'name'} status object for a status name.
+        Resolved strings are memoized, so repeated statuses skip upper() and the lookup.
+        Raises ValueError if the status is not a known execution status.
+        """
+        status_payload = self._resolved_statuses.get(status)
+        if status_payload is not None:
+            return status_payload
+        statuses = self.get_execution_statuses()
+        status_payload = self._status_payloads.get(status.upper())
+        if status_payload is None:
+            raise ValueError(f"Invalid status: {status}. Available statuses: {list(statuses.keys())}")
+        self._resolved_statuses[status] = status_payload
+        return status_payload
+
+    def _build_test_log_data(self,
+                             test_case_id: int,
+                             status: str,
+                             test_case_version_id: Optional[int] = None,
+                             note: Optional[str] = None,
+                             execution_time: Optional[int] = None,
+                             defects: Optional[List[str]] = None,
+                             exe_start_date: Optional[str] = None,
+                             exe_end_date: Optional[str] = None,
+                             steplogs: Optional[Dict] = None,
+                             status_payload: Optional[Dict] = None) -> QTestLogPayload:
+        """
+        Build the test log payload for a single test case result.
+        Pass status_payload (from _status_payload) to skip the status lookup.
+        Raises ValueError if the status is not a known execution status.
+        """
+        if status_payload is None:
+            status_payload = self._status_payload(status)
+        
+        test_log_data: QTestLogPayload = {
+            'status': status_payload,
+            'test_case_version_id': test_case_version_id if test_case_version_id is not None else test_case_id
+        }
+        
+        if note:
+            test_log_data['note'] = note
+        
+        if execution_time:
+            test_log_data['exe_time'] = execution_time
+        
+        if defects:
+            test_log_data['defects'] = [{'id': defect_id} for defect_id in defects]
+        if exe_start_date:
+            test_log_data['exe_start_date'] = exe_start_date
+        if exe_end_date:
+            test_log_data['exe_end_date'] = exe_end_date
+        if steplogs:
+            test_log_data['test_step_logs'] = steplogs['logs']
+        return test_log_data
+
     def update_test_result(self,
                           test_run_id: int,
                           test_case_id: int,
                           status: str,
-                          steplogs: [List[Dict]],
+                          steplogs: Optional[Dict] = None,
                           test_case_version_id: Optional[int] = None,
                           note: Optional[str] = None,
                           execution_time: Optional[int] = None,
@@ -166,96 +366,257 @@ class QTestManager:
             test_run_id: Test run ID
             test_case_id: Test case ID
             status: Execution status (PASSED, FAILED, SKIPPED, etc.)
+            steplogs: Dictionary with a 'logs' list of test step logs (optional)
             note: Execution note/comment (optional)
             execution_time: Execution time in milliseconds (optional)
             defects: List of defect IDs (optional)
-            attachments: List of attachment file paths (optional)
             
         Returns:
             Created test log details
         """
-        self.logger.info(f"Updating test result for test case {test_case_id} in run {test_run_id}")
-        
-        # Get status ID from status name
-        statuses = self.get_execution_statuses()
-        status_upper = status.upper()
-        
-        if status_upper not in statuses:
-            raise ValueError(f"Invalid status: {status}. Available statuses: {list(statuses.keys())}")
-        
-        status_id = statuses[status_upper]
-        
-        test_log_data = {
-            'status': {
-                'id': status_id,
-                'name': status_upper
-            },
-            'test_case_version_id': test_case_version_id if test_case_version_id is not None else test_case_id
-        }
+        self.logger.info("Updating test result for test case %s in run %s", test_case_id, test_run_id)
         
-        if note:
-            test_log_data['note'] = note
-        
-        if execution_time:
-            test_log_data['exe_time'] = execution_time
-        
-        if defects:
-            test_log_data['defects'] = [{'id': defect_id} for defect_id in defects]
-        if exe_start_date:
-            test_log_data['exe_start_date'] = exe_start_date
-        if exe_end_date:
-            test_log_data['exe_end_date'] = exe_end_date
-        test_log_data['test_step_logs'] = steplogs['logs']
+        test_log_data = self._build_test_log_data(
+            test_case_id=test_case_id,
+            status=status,
+            test_case_version_id=test_case_version_id,
+            note=note,
+            execution_time=execution_time,
+            defects=defects,
+            exe_start_date=exe_start_date,
+            exe_end_date=exe_end_date,
+            steplogs=steplogs
+        )
         try:
-            result = self.api.add_test_log(test_run_id, test_log_data)
-            self.logger.info(f"Test result updated successfully. Test log ID: {result.get('id')}")
-            attachementdict=[]
-            for indexnum,steplog in enumerate(steplogs['logs']):
-                if 'attachment' in steplog:
-                        tempattachdict={}
-                        tempattachdict['file_name']=steplog['attachment']
-                        tempattachdict["stepnumber"]=indexnum+1
-                        attachementdict.append(tempattachdict)
-            self.api.create_attachment(result.get('id'),attachementdict)
+            result = self._post_test_log(test_run_id, test_log_data)
+            self.logger.info("Test result updated successfully. Test log ID: %s", result.get('id'))
             return result
         except Exception as e:
             self.logger.error(f"Failed to update test result: {str(e)}")
             raise
+
+    def _post_test_log(self, test_run_id: int, test_log_data: QTestLogPayload) -> Dict:
+        """
+        Post a prebuilt test log payload and upload any step attachments it references.
+
+        Returns:
+            Created test log details
+        """
+        result = self.api.add_test_log(test_run_id, test_log_data)
+        attachementdict=[]
+        for indexnum,steplog in enumerate(test_log_data.get('test_step_logs', [])):
+            if 'attachment' in steplog:
+                    tempattachdict={}
+                    tempattachdict['file_name']=steplog['attachment']
+                    tempattachdict["stepnumber"]=indexnum+1
+                    attachementdict.append(tempattachdict)
+        if attachementdict:
+            self.api.create_attachment(result.get('id'),attachementdict)
+        return result
     
     def bulk_update_test_results(self, 
                                 test_run_id: int,
-                                test_results: List[Dict]) -> List[Dict]:
+                                test_results: List[Dict],
+                                max_workers: Optional[int] = None) -> List[Dict]:
         """
         Update multiple test results in a test run
         
+        All test logs are submitted in a single bulk request. If the server does
+        not support the bulk endpoint, the logs are posted individually using a
+        small thread pool.
+        
         Args:
             test_run_id: Test run ID
             test_results: List of test result dictionaries with keys:
-                         'test_case_id', 'status', 'note' (optional)
+                         'test_case_id', 'status', and optionally 'test_case_version_id',
+                         'note', 'execution_time', 'defects', 'exe_start_date', 'exe_end_date'
+            max_workers: Concurrent requests for the per-log fallback; defaults to the
+                         config's 'max_workers' key, or BULK_FALLBACK_WORKERS
+            
+        Returns:
+            One entry per test result, in input order: the created test log, a
+            {'submitted': True, 'task_id', 'test_case_id'} marker when qTest queued
+            the bulk request, or an {'error', 'test_case_id'} entry
+        """
+        self.logger.info("Bulk updating %d test results", len(test_results))
+        results, pending = self._prepare_test_logs(test_results)
+        
+        if pending:
+            try:
+                created = self.api.bulk_add_test_logs(test_run_id, [log for _, log in pending])
+            except Exception as e:
+                self.logger.error(f"Failed to bulk update test results: {str(e)}")
+                created = [{'error': str(e)}] * len(pending)
+            if created is None:
+                # Bulk endpoint not supported by this server; post the logs concurrently instead
+                def post_one(item):
+                    index, test_log_data = item
+                    try:
+                        return self._post_test_log(test_run_id, test_log_data)
+                    except Exception as e:
+                        self.logger.error(f"Failed to update test case {test_results[index]['test_case_id']}: {str(e)}")
+                        return {'error': str(e)}
+
+                if max_workers is None:
+                    max_workers = self.config.get('max_workers', BULK_FALLBACK_WORKERS)
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    created = list(executor.map(post_one, pending))
+            self._merge_created_test_logs(results, pending, created, test_results)
+        
+        self.logger.info("Bulk update completed. %d successful", sum(1 for r in results if 'error' not in r))
+        return results
+
+    def submit_cycle_test_results(self, test_cycle_id: int, test_results: List[Dict]) -> List[Dict]:
+        """
+        Submit test results for many test cases under a test cycle in one request
+        
+        Unlike bulk_update_test_results no test run ID is needed; each log names
+        its test case and qTest files it under the cycle.
+        
+        Args:
+            test_cycle_id: Test cycle ID
+            test_results: Same dictionaries as bulk_update_test_results
             
         Returns:
-            List of created test log details
+            List of created test log details (or error entries), in input order
+        """
+        self.logger.info("Submitting %d test results to test cycle %s", len(test_results), test_cycle_id)
+        results, pending = self._prepare_test_logs(test_results)
+        
+        if pending:
+            logs = [dict(log, test_case={'id': test_results[index]['test_case_id']}) for index, log in pending]
+            try:
+                created = self.api.submit_auto_test_logs(test_cycle_id, logs)
+            except Exception as e:
+                self.logger.error(f"Failed to submit test results to test cycle {test_cycle_id}: {str(e)}")
+                created = [{'error': str(e)}] * len(pending)
+            self._merge_created_test_logs(results, pending, created, test_results)
+        
+        self.logger.info("Cycle submit completed. %d successful", sum(1 for r in results if 'error' not in r))
+        return results
+
+    async def bulk_update_test_results_async(self,
+                                             test_run_id: int,
+                                             test_results: List[Dict],
+                                             max_connections: int = 100) -> List[Dict]:
+        """
+        Async variant of bulk_update_test_results built on QTestAPIAsync (httpx).
+
+        Uses the bulk endpoint when available; otherwise the test logs are posted
+        concurrently on the event loop, at most max_connections at a time. Step log
+        attachments are not uploaded on this path.
+
+        Args:
+            test_run_id: Test run ID
+            test_results: Same dictionaries as bulk_update_test_results
+            max_connections: Connection pool size for the async client
+
+        Returns:
+            List of created test log details (or error entries), in input order
+        """
+        self.logger.info("Bulk updating %d test results (async)", len(test_results))
+        results, pending = self._prepare_test_logs(test_results)
+        
+        if pending:
+            logs = [log for _, log in pending]
+            try:
+                async with QTestAPIAsync(self.config['qtest_url'], self.config['api_token'],
+                                         self.config['project_id'], max_connections=max_connections) as api:
+                    created = await api.bulk_add_test_logs(test_run_id, logs)
+            except Exception as e:
+                self.logger.error(f"Failed to bulk update test results: {str(e)}")
+                created = [e] * len(pending)
+            if isinstance(created, list):
+                created = [
+                    {'error': str(item)} if isinstance(item, BaseException) else (item or {})
+                    for item in created
+                ]
+            self._merge_created_test_logs(results, pending, created, test_results)
+        
+        self.logger.info("Bulk update completed. %d successful", sum(1 for r in results if 'error' not in r))
+        return results
+
+    def _prepare_test_logs(self, test_results: List[Dict]) -> Tuple[List[Optional[Dict]], List[Tuple[int, QTestLogPayload]]]:
         """
-        self.logger.info(f"Bulk updating {len(test_results)} test results")
+        Build test log payloads for a bulk update.
+
+        The whole batch is validated before any request is sent: rows missing
+        'test_case_id' or 'status', or with an unknown status, become error
+        entries and are never submitted.
+
+        Returns:
+            (results, pending): results holds an error entry for every item whose
+            payload could not be built (None elsewhere); pending holds
+            (index, test_log_data) for the rest
+        """
+        # Resolve statuses once up front so payload building never races on the cache
+        self.get_execution_statuses()
+        resolve_status = self._status_payload
+        build_test_log_data = self._build_test_log_data
         
-        results = []
-        for test_result in test_results:
+        results: List[Optional[Dict]] = [None] * len(test_results)
+        pending = []
+        for index, test_result in enumerate(test_results):
+            test_case_id = test_result.get('test_case_id')
             try:
-                result = self.update_test_result(
-                    test_run_id=test_run_id,
-                    test_case_id=test_result['test_case_id'],
-                    status=test_result['status'],
+                status = test_result.get('status')
+                if test_case_id is None or not status:
+                    raise ValueError("Test result requires 'test_case_id' and 'status'")
+                test_log_data = build_test_log_data(
+                    test_case_id=test_case_id,
+                    status=status,
+                    test_case_version_id=test_result.get('test_case_version_id'),
                     note=test_result.get('note'),
                     execution_time=test_result.get('execution_time'),
-                    defects=test_result.get('defects')
+                    defects=test_result.get('defects'),
+                    exe_start_date=test_result.get('exe_start_date'),
+                    exe_end_date=test_result.get('exe_end_date'),
+                    status_payload=resolve_status(status)
                 )
-                results.append(result)
+                pending.append((index, test_log_data))
             except Exception as e:
-                self.logger.error(f"Failed to update test case {test_result['test_case_id']}: {str(e)}")
-                results.append({'error': str(e), 'test_case_id': test_result['test_case_id']})
-        
-        self.logger.info(f"Bulk update completed. {len([r for r in results if 'error' not in r])} successful")
-        return results
+                self.logger.error(f"Failed to update test case {test_case_id}: {str(e)}")
+                results[index] = {'error': str(e), 'test_case_id': test_case_id}
+        return results, pending
+
+    @staticmethod
+    def _merge_created_test_logs(results: List[Optional[Dict]], pending: List[Tuple[int, QTestLogPayload]],
+                                 created: Union[List[Dict], Dict], test_results: List[Dict]):
+        """
+        Place created test logs (or error entries) at their input positions.
+
+        A dict instead of a list is the queued task of an accepted bulk request;
+        every pending row then gets a success marker carrying the task ID.
+        Created logs that name their test case are matched on its ID; otherwise
+        they are matched by position.
+        """
+        if isinstance(created, dict):
+            for index, _ in pending:
+                results[index] = {'submitted': True, 'task_id': created.get('id'),
+                                  'test_case_id': test_results[index]['test_case_id']}
+            return
+
+        def case_id_of(log: Dict) -> Optional[int]:
+            test_case = log.get('test_case')
+            case_id = test_case.get('id') if isinstance(test_case, dict) else log.get('test_case_id')
+            return int(case_id) if case_id is not None else None
+
+        by_case: Optional[Dict[int, List[Dict]]] = None
+        if created and all('error' not in log and case_id_of(log) is not None for log in created):
+            by_case = {}
+            for log in created:
+                by_case.setdefault(case_id_of(log), []).append(log)
+
+        for position, (index, _) in enumerate(pending):
+            test_case_id = test_results[index]['test_case_id']
+            if by_case is not None:
+                matches = by_case.get(int(test_case_id))
+                result = matches.pop(0) if matches else {'error': 'No test log returned'}
+            else:
+                result = created[position] if position < len(created) else {'error': 'No test log returned'}
+            if 'error' in result:
+                result = dict(result, test_case_id=test_case_id)
+            results[index] = result
     
     def get_test_run_results(self, test_run_id: int) -> List[Dict]:
         """
@@ -267,11 +628,11 @@ class QTestManager:
         Returns:
             List of test log details
         """
-        self.logger.info(f"Fetching test results for test run {test_run_id}")
+        self.logger.info("Fetching test results for test run %s", test_run_id)
         
         try:
             results = self.api.get_test_logs(test_run_id)
-            self.logger.info(f"Retrieved {len(results)} test results")
+            self.logger.info("Retrieved %d test results", len(results))
             return results
         except Exception as e:
             self.logger.error(f"Failed to get test results: {str(e)}")
@@ -292,7 +653,7 @@ class QTestManager:
         Returns:
             Created test cycle details
         """
-        self.logger.info(f"Creating test cycle: {name}")
+        self.logger.info("Creating test cycle: %s", name)
         
         test_cycle_data = {
             'name': name
@@ -306,7 +667,9 @@ class QTestManager:
         
         try:
             result = self.api.create_test_cycle(test_cycle_data)
-            self.logger.info(f"Test cycle created successfully. ID: {result.get('id')}")
+            self.logger.info("Test cycle created successfully. ID: %s", result.get('id'))
+            # Replace any cached miss so get_or_create finds the new cycle
+            self._cache_store(self._cycle_id_cache, name.strip().lower(), result.get('id'))
             return result
         except Exception as e:
             self.logger.error(f"Failed to create test cycle: {str(e)}")
@@ -322,27 +685,46 @@ class QTestManager:
         Resolve a test cycle ID by its name.
         Returns None if not found.
         """
-        self.logger.debug(f"Resolving test cycle ID for name: {cycle_name}")
-        return self.api.find_test_cycle_id_by_name(cycle_name)
+        key = cycle_name.strip().lower()
+        hit, cycle_id = self._cache_lookup(self._cycle_id_cache, key)
+        if hit:
+            return cycle_id
+        self.logger.debug("Resolving test cycle ID for name: %s", cycle_name)
+        return self._cache_store(self._cycle_id_cache, key, self.api.find_test_cycle_id_by_name(cycle_name))
 
     def get_test_case_id_by_name(self, case_name: str) -> Optional[int]:
         """
         Resolve a test case ID by its name.
         Returns None if not found.
         """
-        self.logger.debug(f"Resolving test case ID for name: {case_name}")
-        return self.api.find_test_case_id_by_name(case_name)
+        key = case_name.strip().lower()
+        hit, case_id = self._cache_lookup(self._case_id_cache, key)
+        if hit:
+            return case_id
+        self.logger.debug("Resolving test case ID for name: %s", case_name)
+        return self._cache_store(self._case_id_cache, key, self.api.find_test_case_id_by_name(case_name))
 
     def resolve_test_case_ids_by_names(self, test_case_names: List[str]) -> List[int]:
         """Resolve multiple test case names to IDs (ignoring names not found)."""
-        resolved: List[int] = []
-        missing: List[str] = []
+        ids: Dict[str, Optional[int]] = {}
+        lookup: List[str] = []
         for name in test_case_names:
-            cid = self.get_test_case_id_by_name(name)
-            if cid:
-                resolved.append(cid)
+            hit, cid = self._cache_lookup(self._case_id_cache, name.strip().lower())
+            if hit:
+                ids[name] = cid
             else:
-                missing.append(name)
+                lookup.append(name)
+        if lookup:
+            # One batched search for every name not already memoized
+            try:
+                found = self.api.find_test_case_ids_by_names(lookup)
+                for name in lookup:
+                    ids[name] = self._cache_store(self._case_id_cache, name.strip().lower(), found.get(name))
+            except Exception as e:
+                self.logger.error(f"Failed to resolve test case names: {e}")
+                ids.update((name, None) for name in lookup)
+        resolved = [ids[name] for name in test_case_names if ids[name]]
+        missing = [name for name in test_case_names if not ids[name]]
         if missing:
             self.logger.warning(f"Could not resolve test cases: {missing}")
         return resolved
@@ -404,7 +786,7 @@ class QTestManager:
         """
         Approve a test case version by ID.
         """
-        self.logger.info(f"Approving test case ID: {test_case_id}")
+        self.logger.info("Approving test case ID: %s", test_case_id)
         return self.api.approve_test_case(int(test_case_id))
 
     def approve_test_case_by_name(self, case_name: str) -> Dict:
@@ -423,15 +805,17 @@ class QTestManager:
                                  test_case_id: int,
                                  create_if_missing: bool = True,
                                  exe_start_date: Optional[str] = None,
-                                 exe_end_date: Optional[str] = None) -> int:
+                                 exe_end_date: Optional[str] = None,
+                                 name: Optional[str] = None) -> int:
         """
         Ensure a test run exists for the given test case under a parent (e.g., test-suite).
         If found, returns the existing test run ID. Otherwise, creates it (if allowed) and returns its ID.
+        Pass name (e.g. the test case name, if already known) to avoid fetching the test case for a default run name.
         """
-        self.logger.info(f"Ensuring test run for case {test_case_id} under {parent_type}:{parent_id}")
+        self.logger.info("Ensuring test run for case %s under %s:%s", test_case_id, parent_type, parent_id)
         existing_id = self.api.find_test_run_id_by_test_case(parent_id, parent_type, test_case_id)
         if existing_id:
-            self.logger.info(f"Found existing test run {existing_id} for test case {test_case_id}")
+            self.logger.info("Found existing test run %s for test case %s", existing_id, test_case_id)
             return int(existing_id)
         if not create_if_missing:
             raise ValueError(f"No test run found for test case {test_case_id} under {parent_type}:{parent_id}")
@@ -439,21 +823,67 @@ class QTestManager:
             parent_id=parent_id,
             parent_type=parent_type,
             test_case_id=test_case_id,
+            name=name,
             exe_start_date=exe_start_date,
             exe_end_date=exe_end_date
         )
         run_id = created.get('id')
-        self.logger.info(f"Created new test run {run_id} for test case {test_case_id}")
+        self.logger.info("Created new test run %s for test case %s", run_id, test_case_id)
         return int(run_id)
 
+    def create_test_runs_for_cases(self,
+                                   parent_id: int,
+                                   parent_type: str,
+                                   test_case_ids: List[int],
+                                   names: Optional[List[str]] = None) -> List[Dict]:
+        """
+        Create one test run per test case under a parent (e.g., test-suite) in a single batch request.
+        Run names default to the test case names; missing names are fetched
+        concurrently. Falls back to one request per run if the server does not
+        support batch creation.
+        
+        Returns:
+            List of created test runs, in the order of test_case_ids
+        """
+        self.logger.info("Creating %d test runs under %s:%s", len(test_case_ids), parent_type, parent_id)
+        case_ids = [int(test_case_id) for test_case_id in test_case_ids]
+        names = list(names or [])
+        names = [names[index] if index < len(names) else None for index in range(len(case_ids))]
+        missing = [index for index, name in enumerate(names) if not name]
+        if missing:
+            def case_name(index: int) -> str:
+                tc = self.api.get_test_case(case_ids[index]) or {}
+                return tc.get('name', f'Test Run for {case_ids[index]}')
+
+            max_workers = min(len(missing), self.config.get('max_workers', BULK_FALLBACK_WORKERS))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for index, name in zip(missing, executor.map(case_name, missing)):
+                    names[index] = name
+        runs = [{'name': name, 'test_case': {'id': case_id}} for case_id, name in zip(case_ids, names)]
+
+        created = self.api.batch_create_test_runs(parent_id, parent_type, runs)
+        if created is None:
+            created = [
+                self.api.create_test_run_for_case(parent_id=parent_id, parent_type=parent_type,
+                                                  test_case_id=run['test_case']['id'], name=run['name'])
+                for run in runs
+            ]
+        self.logger.info("Created %d test runs under %s:%s", len(created), parent_type, parent_id)
+        return created
+
     # -------- Test step helpers --------
     def get_test_step_id_by_order(self, test_case_id: int, step_number: int) -> Optional[int]:
         """
         Return the test step ID for the given test case by step order/number.
         """
-        self.logger.debug(f"Resolving step id for test case {test_case_id} order {step_number}")
         try:
-            return self.api.find_test_step_id_by_order(int(test_case_id), int(step_number))
+            key = (int(test_case_id), int(step_number))
+            hit, step_id = self._cache_lookup(self._step_id_by_order_cache, key)
+            if hit:
+                return step_id
+            self.logger.debug("Resolving step id for test case %s order %s", test_case_id, step_number)
+            return self._cache_store(self._step_id_by_order_cache, key,
+                                     self.api.find_test_step_id_by_order(*key))
         except Exception as e:
             self.logger.error(f"Failed to get step id for case {test_case_id} order {step_number}: {e}")
             return None
@@ -462,19 +892,27 @@ class QTestManager:
         """
         Return the test step ID by matching name/description fields.
         Matches against 'name', 'description', or 'action' fields case-insensitively.
+        Matching is exact after trimming whitespace (not a substring match); when
+        several steps match, the first one in step order is returned. Misses are
+        answered from the cached step index without another request.
         """
         try:
-            steps = self.api.get_test_steps(int(test_case_id)) or []
             target = str(step_name).strip().lower()
-            for s in steps:
-                candidates = [
-                    str(s.get('name', '')).strip().lower(),
-                    str(s.get('description', '')).strip().lower(),
-                    str(s.get('action', '')).strip().lower(),
-                ]
-                if target and target in candidates:
-                    return s.get('id')
-            return None
+            if not target:
+                return None
+            case_id = int(test_case_id)
+            hit, index = self._cache_lookup(self._step_name_index_cache, case_id)
+            if not hit:
+                index = {}
+                # Steps in order; the first step matching on any field wins, as before
+                for s in self.api.get_test_steps(case_id) or []:
+                    step_id = s.get('id')
+                    for field in ('name', 'description', 'action'):
+                        value = s.get(field)
+                        if value:
+                            index.setdefault(str(value).strip().lower(), step_id)
+                self._cache_store(self._step_name_index_cache, case_id, index)
+            return index.get(target)
         except Exception as e:
             self.logger.error(f"Failed to get step id by name for case {test_case_id}: {e}")
             return None
@@ -3,8 +3,13 @@ QTest Robot Framework Library
 Provides keywords for integrating QTest with Robot Framework tests
 """
 
+import os
+import re
 import sys
+import threading
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -30,42 +35,169 @@ except ImportError:
     BuiltIn = None
 
 
+# Integer test case / parent / step IDs as passed from Robot (e.g. "12345");
+# accepts the same decimal strings as int(): sign, underscores, Unicode digits
+_ID_RE = re.compile(r'[+-]?\d+(?:_\d+)*')
+
+# Separator for comma-separated test case ID/name lists, absorbing surrounding whitespace
+_TOKEN_SPLIT_RE = re.compile(r'\s*,\s*')
+
+
+def _as_int_id(value) -> Optional[int]:
+    """Return value as an int if it is an integer or integer-like string, else None"""
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    text = str(value).strip()
+    return int(text) if _ID_RE.fullmatch(text) else None
+
+
+# qTest step log status IDs by status name (unknown names are sent with id 0)
+STEP_STATUS_IDS = {
+    'PASSED': 601,
+    'FAILED': 602,
+    'SKIPPED': 603,
+    'BLOCKED': 604
+}
+
+# Queued results per test run are submitted once this many are pending
+QUEUE_FLUSH_THRESHOLD = 50
+
+# Most recent reported test logs kept on the library instance
+RESULT_HISTORY_LIMIT = 10000
+
+# Background threads submitting results while the next tests run
+REPORT_WORKERS = 8
+
+# Robot ignores log calls made outside the main thread, so background
+# submissions collect their messages here and 'Finalize QTest Run' emits them
+_thread_logs = threading.local()
+
+
+def _log(level: str, msg: str):
+    """Log through Robot's logger, or buffer the message on a background worker"""
+    lines = getattr(_thread_logs, 'lines', None)
+    if lines is not None:
+        lines.append((level, msg))
+    else:
+        getattr(logger, level)(msg)
+
+
+def _run_collecting_logs(fn, *args) -> Tuple[List[Tuple[str, str]], Optional[BaseException]]:
+    """Call fn(*args) on a worker thread; return its buffered log lines and any error"""
+    _thread_logs.lines = lines = []
+    try:
+        fn(*args)
+        return lines, None
+    except Exception as e:
+        return lines, e
+    finally:
+        _thread_logs.lines = None
+
+
 class QTestRobotLibrary:
     """Robot Framework library for QTest integration"""
     
+    # The library listens to its own run to notice 'Set Log Level' (see end_keyword)
+    ROBOT_LISTENER_API_VERSION = 2
+    
+    # Fixed attribute set; keyword calls read these on every invocation
+    __slots__ = (
+        'ROBOT_LIBRARY_LISTENER',
+        'manager', '_config_path', 'test_run_id',
+        'test_results', '_result_count', '_result_lock', 'test_start_times',
+        '_pending_results', '_pool', '_futures', '_approved_versions', '_debug',
+    )
+    
     _NOT_INITIALIZED_MSG = "QTest Manager not initialized. Call 'Initialize QTest Manager' first."
     
     def __init__(self):
         """Initialize the library"""
         self.manager = None
+        # Absolute path of the config the current manager was built from
+        self._config_path = None
         self.test_run_id = None
-        self.test_results = []
-        self.test_start_times = {}
+        # Recent test logs (bounded) and the total reported since the library was created
+        self.test_results: deque = deque(maxlen=RESULT_HISTORY_LIMIT)
+        self._result_count = 0
+        self._result_lock = threading.Lock()
+        self.test_start_times: Dict[str, int] = {}
+        # test_run_id -> results queued by 'Queue QTest Result', submitted in bulk
+        self._pending_results: Dict[int, List[Dict]] = {}
+        # Background submissions awaited by 'Finalize QTest Run'; pool created on first use
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._futures: List[Tuple[str, Future]] = []
+        # test case ID -> approved version ID, so each case is approved once per run
+        self._approved_versions: Dict[int, int] = {}
+        # Whether Robot logs DEBUG messages; None until read from ${LOG_LEVEL}
+        self._debug: Optional[bool] = None
+        self.ROBOT_LIBRARY_LISTENER = self
         
     def initialize_qtest_manager(self, config_path: str = 'config.json'):
         """
         Initialize QTest Manager with configuration
         
+        Calling this again with the same config (e.g. from a Test Setup) keeps
+        the existing manager, so its pooled HTTP connections and lookup caches
+        are reused across tests. A different config replaces the manager once
+        queued and background submissions made through the old one are done.
+        
         Args:
             config_path: Path to QTest configuration file
             
         Example:
             | Initialize QTest Manager | config.json |
         """
+        resolved_path = os.path.abspath(config_path)
+        self._debug = None
+        if self.manager is not None and resolved_path == self._config_path:
+            if self._debug_enabled():
+                logger.debug(f"QTest Manager already initialized with config: {config_path}")
+            return
         try:
-            self.manager = QTestManager(config_path)
+            manager = QTestManager(config_path)
+            if self.manager is not None:
+                if self._pending_results:
+                    self.flush_qtest_results()
+                self._wait_for_background()
+                self.manager.close()
+            self.manager = manager
+            self._config_path = resolved_path
+            self._approved_versions.clear()
             logger.info(f"QTest Manager initialized with config: {config_path}")
         except Exception as e:
             logger.error(f"Failed to initialize QTest Manager: {str(e)}")
             raise
     
+    def end_keyword(self, name, attrs):
+        """Listener hook: re-read the log level after 'Set Log Level' changed it"""
+        if name == 'BuiltIn.Set Log Level':
+            self._debug = None
+
     # -------- Internal helpers (keep public keywords simpler) --------
+    def _debug_enabled(self) -> bool:
+        """
+        Whether Robot's log level lets DEBUG messages through, so hot paths can
+        skip building debug strings. ${LOG_LEVEL} is read once and re-read after
+        'Initialize QTest Manager' or 'Set Log Level'; True when Robot is not
+        running, since the fallback logger prints everything.
+        """
+        if self._debug is None:
+            level = None
+            if BuiltIn is not None:
+                try:
+                    level = BuiltIn().get_variable_value('${LOG_LEVEL}')
+                except Exception:
+                    level = None
+            self._debug = level is None or str(level).upper() in ('DEBUG', 'TRACE')
+        return self._debug
+
     def _normalize_tokens(self, test_case_ids) -> List[str]:
         """Normalize provided IDs/names into a list of string tokens."""
         if isinstance(test_case_ids, str):
-            return [t.strip() for t in test_case_ids.split(',') if t and t.strip()]
+            return [t for t in _TOKEN_SPLIT_RE.split(test_case_ids.strip()) if t]
         if isinstance(test_case_ids, (list, tuple)):
-            return [str(t).strip() for t in test_case_ids if str(t).strip()]
+            stripped = (str(t).strip() for t in test_case_ids)
+            return [t for t in stripped if t]
         return [str(test_case_ids).strip()]
 
     def _resolve_tokens_to_ids(self, tokens: List[str]) -> Tuple[List[int], List[str]]:
@@ -73,26 +205,48 @@ class QTestRobotLibrary:
         Returns (resolved_ids, missing_names)."""
         resolved_ids: List[int] = []
         missing: List[str] = []
+        # Each distinct name is resolved once, even if it is repeated
+        by_name: Dict[str, Optional[int]] = {}
         for tok in tokens:
             # Try integer ID first
-            try:
-                resolved_ids.append(int(tok))
+            tok_id = _as_int_id(tok)
+            if tok_id is not None:
+                resolved_ids.append(tok_id)
                 continue
-            except Exception:
-                pass
 
             # Resolve by name via manager
-            try:
-                tc_id = self.manager.get_test_case_id_by_name(tok)
-            except Exception as e:
-                logger.error(f"Error resolving test case '{tok}': {e}")
-                tc_id = None
+            if tok not in by_name:
+                try:
+                    by_name[tok] = self.manager.get_test_case_id_by_name(tok)
+                except Exception as e:
+                    logger.error(f"Error resolving test case '{tok}': {e}")
+                    by_name[tok] = None
+            tc_id = by_name[tok]
             if tc_id is not None:
                 resolved_ids.append(int(tc_id))
             else:
                 missing.append(tok)
         return resolved_ids, missing
     
+    def _resolve_first_token_to_id(self, tokens: List[str]) -> int:
+        """Resolve only the first token (ID or name) to a test case ID.
+        Raises ValueError if there is no token or it cannot be resolved."""
+        if not tokens:
+            raise ValueError("No valid test case IDs resolved. Provide IDs or names that exist in qTest.")
+        tok = tokens[0]
+        tc_id = _as_int_id(tok)
+        if tc_id is not None:
+            return tc_id
+        try:
+            tc_id = self.manager.get_test_case_id_by_name(tok)
+        except Exception as e:
+            logger.error(f"Error resolving test case '{tok}': {e}")
+            tc_id = None
+        if tc_id is None:
+            logger.error(f"Could not resolve test case names to IDs: {[tok]}")
+            raise ValueError(f"Unresolved test case names: {[tok]}")
+        return int(tc_id)
+
     def create_qtest_test_run(self, name: str, test_case_name,
                               test_cycle_name: Optional[str] = None,
                               description: Optional[str] = None,
@@ -119,22 +273,17 @@ class QTestRobotLibrary:
         if not self.manager:
             raise RuntimeError(self._NOT_INITIALIZED_MSG)
         
-        # Normalize provided test_case_name into a list of integer IDs, resolving names when needed
+        # Only the first test case is used for the run, so only it is resolved
         tokens = self._normalize_tokens(test_case_name)
-        resolved_ids, missing = self._resolve_tokens_to_ids(tokens)
-
-        if missing:
-            logger.error(f"Could not resolve test case names to IDs: {missing}")
-            raise ValueError(f"Unresolved test case names: {missing}")
-
-        if not resolved_ids:
-            raise ValueError("No valid test case IDs resolved. Provide IDs or names that exist in qTest.")
+        if len(tokens) > 1:
+            logger.warn(f"Test run '{name}' is created for the first test case only: {tokens[0]}")
+        tc_id = self._resolve_first_token_to_id(tokens)
         
-        testcaseversionid = approve_qtest_test_case(resolved_ids[0])
+        testcaseversionid = self.approve_qtest_test_case(tc_id)
         try:
             test_run = self.manager.create_test_run(
                 name=name,
-                test_case_id=resolved_ids[0],
+                test_case_id=tc_id,
                 test_case_version_id=testcaseversionid,
                 test_cycle_name=test_cycle_name if test_cycle_name else None,
                 description=description,
@@ -182,16 +331,24 @@ class QTestRobotLibrary:
                            
                            execution_time: int = 0,
                            exe_start_date: Optional[str] = None,
-                           exe_end_date: Optional[str] = None):
+                           exe_end_date: Optional[str] = None,
+                           wait: bool = True):
         """
         Report test result to QTest
         
+        Returns the created test log. With wait=False the result is instead
+        submitted on a background thread and the keyword returns None straight
+        away, so the next test does not wait for qTest; 'Finalize QTest Run'
+        waits for outstanding submissions and logs their messages and failures.
+        
         Args:
             test_run_id: Test run ID
             test_case_id: Test case ID
             status: Test status (PASSED, FAILED, SKIPPED, etc.)
             message: Optional message/note
             execution_time: Execution time in milliseconds
+            wait: Submit synchronously and return the created test log (default);
+                  False submits in the background
             
         Example:
             | Report QTest Result | 100 | 12345 | PASSED | Test passed | 3000 |
@@ -199,19 +356,14 @@ class QTestRobotLibrary:
         if not self.manager:
             raise RuntimeError(self._NOT_INITIALIZED_MSG)
         
+        submit_args = (test_run_id, test_case_id, status, steplogs, message,
+                       execution_time, exe_start_date, exe_end_date)
+        if not wait:
+            self._submit_background(f"Test Case {test_case_id} - {status}",
+                                    self._submit_test_result, *submit_args)
+            return None
         try:
-            testcaseversionid = approve_qtest_test_case(test_case_id)
-            result = self.manager.update_test_result(
-                test_run_id=int(test_run_id),
-                test_case_id=int(test_case_id),
-                status=status.upper(),
-                test_case_version_id=testcaseversionid,
-                steplogs=steplogs,
-                note=message,
-                execution_time=int(execution_time) if execution_time else None,
-                exe_start_date=exe_start_date,
-                exe_end_date=exe_end_date
-            )
+            result = self._submit_test_result(*submit_args)
             logger.info(f"Test result reported: Test Case {test_case_id} - {status}")
             return result
         except Exception as e:
@@ -219,6 +371,52 @@ class QTestRobotLibrary:
             # Don't raise - we don't want QTest reporting to fail the test
             return None
 
+    def _submit_test_result(self, test_run_id, test_case_id, status, steplogs, message,
+                            execution_time, exe_start_date, exe_end_date) -> Dict:
+        """Approve the test case and post its test log (runs on the calling or a pool thread)"""
+        testcaseversionid = self.approve_qtest_test_case(test_case_id)
+        result = self.manager.update_test_result(
+            test_run_id=int(test_run_id),
+            test_case_id=int(test_case_id),
+            status=status.upper(),
+            test_case_version_id=testcaseversionid,
+            steplogs=steplogs,
+            note=message,
+            execution_time=int(execution_time) if execution_time else None,
+            exe_start_date=exe_start_date,
+            exe_end_date=exe_end_date
+        )
+        self._record_results([result])
+        return result
+
+    def _record_results(self, results: List[Dict]):
+        """Keep reported test logs and count the successful ones (thread-safe)"""
+        recorded = [r for r in results if isinstance(r, dict) and 'error' not in r]
+        with self._result_lock:
+            self.test_results.extend(recorded)
+            self._result_count += len(recorded)
+
+    def _submit_background(self, label: str, fn, *args):
+        """Run fn(*args) on the reporting pool; 'Finalize QTest Run' collects the outcome"""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=REPORT_WORKERS, thread_name_prefix='qtest-report')
+        self._futures.append((label, self._pool.submit(_run_collecting_logs, fn, *args)))
+
+    def _wait_for_background(self):
+        """Wait for background submissions, emitting their log messages from the main thread"""
+        futures, self._futures = self._futures, []
+        for label, future in futures:
+            lines, error = future.result()
+            for level, msg in lines:
+                getattr(logger, level)(msg)
+            if error is not None:
+                logger.error(f"Failed to report test result ({label}): {error}")
+            else:
+                logger.info(f"Test result reported: {label}")
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
     def report_qtest_result_by_name(self, test_run_id: int, test_case_name: str,
                                     status: str, message: str = "",
                                     execution_time: int = 0):
@@ -239,12 +437,73 @@ class QTestRobotLibrary:
                 note=message,
                 execution_time=int(execution_time) if execution_time else None
             )
+            self._record_results([result])
             logger.info(f"Test result reported by name: {test_case_name} - {status}")
             return result
         except Exception as e:
             logger.error(f"Failed to report test result by name: {str(e)}")
             return None
     
+    def queue_qtest_result(self, test_run_id: int, test_case_id: int,
+                           status: str, message: str = "",
+                           execution_time: int = 0,
+                           exe_start_date: Optional[str] = None,
+                           exe_end_date: Optional[str] = None,
+                           test_case_version_id: Optional[int] = None):
+        """
+        Queue a test result to be sent to QTest together with other results.
+
+        Queued results are submitted in one bulk request per test run when
+        QUEUE_FLUSH_THRESHOLD results are pending for the run, on 'Flush QTest
+        Results', and on 'Finalize QTest Run'. Unlike 'Report QTest Result',
+        the test case is not approved; pass test_case_version_id if needed.
+
+        Example:
+            | Queue QTest Result | 100 | 12345 | PASSED | Test passed | 3000 |
+        """
+        if not self.manager:
+            raise RuntimeError(self._NOT_INITIALIZED_MSG)
+
+        run_id = int(test_run_id)
+        pending = self._pending_results.setdefault(run_id, [])
+        pending.append({
+            'test_case_id': int(test_case_id),
+            'status': status.upper(),
+            'test_case_version_id': int(test_case_version_id) if test_case_version_id else None,
+            'note': message,
+            'execution_time': int(execution_time) if execution_time else None,
+            'exe_start_date': exe_start_date,
+            'exe_end_date': exe_end_date
+        })
+        if self._debug_enabled():
+            logger.debug(f"Queued test result: Test Case {test_case_id} - {status}")
+        if len(pending) >= QUEUE_FLUSH_THRESHOLD:
+            self.flush_qtest_results(run_id)
+
+    def flush_qtest_results(self, test_run_id: Optional[int] = None) -> List[Dict]:
+        """
+        Submit queued test results in bulk.
+
+        Args:
+            test_run_id: Only flush this test run's queue (default: all runs)
+
+        Returns:
+            Results of the bulk submissions, in queue order
+
+        Example:
+            | Flush QTest Results |
+        """
+        if not self.manager:
+            raise RuntimeError(self._NOT_INITIALIZED_MSG)
+
+        run_ids = [int(test_run_id)] if test_run_id is not None else list(self._pending_results)
+        submitted: List[Dict] = []
+        for run_id in run_ids:
+            pending = self._pending_results.pop(run_id, None)
+            if pending:
+                submitted.extend(self.bulk_report_qtest_results(run_id, pending))
+        return submitted
+
     def bulk_report_qtest_results(self, test_run_id: int, test_results: List[Dict]):
         """
         Report multiple test results to QTest in bulk
@@ -265,6 +524,7 @@ class QTestRobotLibrary:
                 test_run_id=int(test_run_id),
                 test_results=test_results
             )
+            self._record_results(results)
             logger.info(f"Bulk test results reported: {len(results)} results")
             return results
         except Exception as e:
@@ -325,8 +585,10 @@ class QTestRobotLibrary:
         Example:
             | Start Test Timer | TC001_Login |
         """
-        self.test_start_times[test_name] = time.time()
-        logger.debug(f"Timer started for test: {test_name}")
+        # Monotonic, so wall-clock adjustments (NTP) cannot skew durations
+        self.test_start_times[test_name] = time.perf_counter_ns()
+        if self._debug_enabled():
+            logger.debug(f"Timer started for test: {test_name}")
     
     def get_test_duration_ms(self, test_name: str) -> int:
         """
@@ -346,20 +608,28 @@ class QTestRobotLibrary:
             return 0
         
         start_time = self.test_start_times[test_name]
-        duration_ms = int((time.time() - start_time) * 1000)
-        logger.debug(f"Test {test_name} duration: {duration_ms}ms")
+        duration_ms = (time.perf_counter_ns() - start_time) // 1_000_000
+        if self._debug_enabled():
+            logger.debug(f"Test {test_name} duration: {duration_ms}ms")
         return duration_ms
     
     def finalize_qtest_run(self):
         """
         Finalize QTest test run (cleanup, logging, etc.)
         
+        Submits any results still queued by 'Queue QTest Result' and waits for
+        results reported in the background.
+
         Example:
             | Finalize QTest Run |
         """
+        if self.manager and self._pending_results:
+            self.flush_qtest_results()
+        self._wait_for_background()
+        self.test_start_times.clear()
         if self.test_run_id:
             logger.info(f"Test run {self.test_run_id} finalized")
-            logger.info(f"Total test results recorded: {len(self.test_results)}")
+            logger.info(f"Total test results recorded: {self._result_count}")
         else:
             logger.warn("No test run was created")
     
@@ -419,16 +689,13 @@ class QTestRobotLibrary:
             raise RuntimeError(self._NOT_INITIALIZED_MSG)
 
         # Normalize/convert inputs from Robot
-        try:
-            pid = int(str(parent_id).strip())
-        except Exception:
+        pid = _as_int_id(parent_id)
+        if pid is None:
             raise ValueError(f"Invalid parent_id: {parent_id}")
 
-        tc_id: Optional[int] = None
         # If numeric-like, treat as ID; otherwise resolve by name
-        try:
-            tc_id = int(str(test_case).strip())
-        except Exception:
+        tc_id = _as_int_id(test_case)
+        if tc_id is None:
             tc_id = self.manager.get_test_case_id_by_name(str(test_case))
 
         if tc_id is None:
@@ -448,6 +715,8 @@ class QTestRobotLibrary:
     def approve_qtest_test_case(self, test_case) -> int:
         """
         Approve a qTest test case by ID or name and return its version ID.
+        Each test case is approved once per library instance; later calls
+        return the remembered version ID without contacting qTest.
 
         Args:
             test_case: Numeric ID or case name.
@@ -463,39 +732,51 @@ class QTestRobotLibrary:
             raise RuntimeError(self._NOT_INITIALIZED_MSG)
 
         # Resolve ID if a name was provided
-        tc_id: Optional[int] = None
-        try:
-            tc_id = int(str(test_case).strip())
-        except Exception:
+        tc_id = _as_int_id(test_case)
+        if tc_id is None:
             tc_id = self.manager.get_test_case_id_by_name(str(test_case))
         if tc_id is None:
             raise ValueError(f"Test case not found: {test_case}")
 
-        # Approve the test case
+        # Already approved during this run
+        version_id = self._approved_versions.get(tc_id)
+        if version_id is not None:
+            return version_id
+
+        # Approve the test case; the response normally carries the approved version
         try:
-            self.manager.approve_test_case(tc_id)
-            logger.info(f"Approved test case ID {tc_id}")
+            approved = self.manager.approve_test_case(tc_id)
+            _log('info', f"Approved test case ID {tc_id}")
         except Exception as e:
-            logger.error(f"Failed to approve test case {tc_id}: {e}")
+            _log('error', f"Failed to approve test case {tc_id}: {e}")
             raise
+        version_id = self._version_id_of(approved)
+        if version_id is not None:
+            self._approved_versions[tc_id] = version_id
+            return version_id
 
-        # Fetch details to retrieve version id
+        # Older servers return no body; fetch details to retrieve version id
         try:
-            details = self.manager.api.get_test_case(tc_id) or {}
-            version_id = (
-                details.get('test_case_version_id')
-                or (details.get('version') or {}).get('id')
-            )
+            version_id = self._version_id_of(self.manager.api.get_test_case(tc_id))
             if version_id is None:
                 # Fallback: if not present, return the test case id as best-effort
-                logger.warn("No explicit version id found; falling back to test case id")
-                version_id = tc_id
-            return int(version_id)
+                _log('warn', "No explicit version id found; falling back to test case id")
+                version_id = int(tc_id)
+            self._approved_versions[tc_id] = version_id
+            return version_id
         except Exception as e:
-            logger.error(f"Failed to retrieve version id for test case {tc_id}: {e}")
+            _log('error', f"Failed to retrieve version id for test case {tc_id}: {e}")
             # Fallback: return the original ID if details fetch fails
             return int(tc_id)
 
+    @staticmethod
+    def _version_id_of(details) -> Optional[int]:
+        """Extract the test case version ID from a test case/approval response, if present"""
+        if not isinstance(details, dict):
+            return None
+        version_id = details.get('test_case_version_id') or (details.get('version') or {}).get('id')
+        return int(version_id) if version_id is not None else None
+
     def create_qtest_test_step_log(self, testcaseid, step_number, result: str,
                                    actual_result: str = "",
                                    expected_result: Optional[str] = None,
@@ -518,23 +799,16 @@ class QTestRobotLibrary:
             | ${step}= | Create QTest Test Step Log | 1 | PASSED | Actual ok | Expected ok | Step ran fine |
         """
         # Normalize/validate inputs
-        try:
-            order = int(str(step_number).strip())
-        except Exception:
+        order = _as_int_id(step_number)
+        if order is None:
             raise ValueError(f"Invalid step number: {step_number}")
 
         status_name = str(result).strip().upper()
         if not status_name:
             raise ValueError("Result/status must be provided for step log")
-        statusname_ids={
-            'PASSED': 601,
-            'FAILED': 602,
-            'SKIPPED': 603,
-            'BLOCKED': 604
-        }
         payload: Dict = {
             # 'order': order,
-            'status': { 'id': statusname_ids.get(status_name, 0), 'name': status_name },
+            'status': { 'id': STEP_STATUS_IDS.get(status_name, 0), 'name': status_name },
             'actual_result': actual_result or ""
         }
         if expected_result is not None:
@@ -551,10 +825,12 @@ class QTestRobotLibrary:
                     if step_id is not None:
                         payload['test_step_id'] = int(step_id)
         except Exception as e:
-            logger.debug(f"Could not resolve qTest step id for order {order}: {e}")
+            if self._debug_enabled():
+                logger.debug(f"Could not resolve qTest step id for order {order}: {e}")
         if attachment:
             payload['attachment'] = attachment
-        logger.debug(f"Created test step log payload: {payload}")
+        if self._debug_enabled():
+            logger.debug(f"Created test step log payload: {payload}")
         return payload
 
     def append_qtest_test_step_log(self, testcaseid, container,
@@ -592,54 +868,25 @@ class QTestRobotLibrary:
             return container
         raise ValueError("Container must be a list, a dict (with 'logs'), or empty/None to start a new list")
     
-# Instantiate a single library instance for module-level keyword wrappers
+# Instantiate a single library instance for module-level keywords
 _LIB = QTestRobotLibrary()
 
-# Module-level keyword wrappers so Robot Framework can discover keywords when
-# importing the library using a file path (e.g., `Library    ../../qtest_robot_library.py`).
-def initialize_qtest_manager(config_path: str = 'config.json'):
-    return _LIB.initialize_qtest_manager(config_path)
-
-def create_qtest_test_run(name: str, test_case_name, test_cycle_name: Optional[str] = None, description: Optional[str] = None, build_version: Optional[str] = None):
-    return _LIB.create_qtest_test_run(name, test_case_name, test_cycle_name, description, build_version)
-
-def create_qtest_test_run_by_names(name: str, test_case_names, test_cycle_name: Optional[str] = None, description: Optional[str] = None):
-    return _LIB.create_qtest_test_run_by_names(name, test_case_names, test_cycle_name, description)
-
-def report_qtest_result(test_run_id: int, test_case_id: int, status: str, steplogs, message: str = "", execution_time: int = 0, exe_start_date: Optional[str] = None, exe_end_date: Optional[str] = None):
-    return _LIB.report_qtest_result(test_run_id, test_case_id, status, steplogs, message, execution_time, exe_start_date, exe_end_date)
-def report_qtest_result_by_name(test_run_id: int, test_case_name: str, status: str, message: str = "", execution_time: int = 0):
-    return _LIB.report_qtest_result_by_name(test_run_id, test_case_name, status, message, execution_time)
-
-def bulk_report_qtest_results(test_run_id: int, test_results: List[Dict]):
-    return _LIB.bulk_report_qtest_results(test_run_id, test_results)
-
-def get_qtest_execution_statuses() -> List[str]:
-    return _LIB.get_qtest_execution_statuses()
-
-def get_qtest_test_case_id_by_name(test_case_name: str) -> int:
-    return _LIB.get_qtest_test_case_id_by_name(test_case_name)
-
-def start_test_timer(test_name: str):
-    return _LIB.start_test_timer(test_name)
-
-def get_test_duration_ms(test_name: str) -> int:
-    return _LIB.get_test_duration_ms(test_name)
-
-def finalize_qtest_run():
-    return _LIB.finalize_qtest_run()
-
-def create_qtest_test_cycle(name: str, description: str = "") -> int:
-    return _LIB.create_qtest_test_cycle(name, description)
+# Public methods of the library instance, exposed as module-level keywords
+_KEYWORD_NAMES = frozenset(
+    name for name in dir(QTestRobotLibrary)
+    if not name.startswith('_') and callable(getattr(_LIB, name))
+)
 
-def ensure_qtest_test_run_for_case(parent_id, parent_type: str, test_case, create_if_missing: bool = True, exe_start_date: Optional[str] = None, exe_end_date: Optional[str] = None) -> int:
-    return _LIB.ensure_qtest_test_run_for_case(parent_id, parent_type, test_case, create_if_missing, exe_start_date, exe_end_date)
 
-def approve_qtest_test_case(test_case) -> int:
-    return _LIB.approve_qtest_test_case(test_case)
+# Module-level keywords so Robot Framework can discover them when importing the
+# library using a file path (e.g., `Library    ../../qtest_robot_library.py`).
+# Attribute access is forwarded to the bound methods of _LIB (PEP 562), so the
+# keyword signatures always match the methods and no wrapper frame is added.
+def __getattr__(name: str):
+    if name in _KEYWORD_NAMES:
+        return getattr(_LIB, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-def create_qtest_test_step_log(step_number, result: str, actual_result: str = "", expected_result: Optional[str] = None, description: Optional[str] = None) -> Dict:
-    return _LIB.create_qtest_test_step_log(step_number, result, actual_result, expected_result, description)
 
-def append_qtest_test_step_log(testcaseid,container, step_number, result: str, actual_result: str = "", expected_result: Optional[str] = None, description: Optional[str] = None, attachment: Optional[str] = None):
-    return _LIB.append_qtest_test_step_log(testcaseid, container, step_number, result, actual_result, expected_result, description, attachment)
\ No newline at end of file
+def __dir__():
+    return sorted(set(globals()) | _KEYWORD_NAMES)
@@ -0,0 +1,84 @@
+"""
+Shared pytest fixtures
+"""
+
+import json
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+import responses
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from qtest_api import QTestAPI
+
+
+CONFIG_DATA = {
+    "qtest_url": "https://test.qtestnet.com",
+    "api_token": "test-token-123",
+    "project_id": 12345,
+    "log_level": "INFO"
+}
+
+# CONFIG_DATA serialized once at import time
+CONFIG_BYTES = json.dumps(CONFIG_DATA).encode()
+
+# Canned qTest responses replayed by the qtest_http fixture
+CASSETTE_DIR = Path(__file__).parent / "cassettes"
+
+
+@pytest.fixture(scope="session")
+def config_data():
+    """Contents of the mock configuration file; treat as read-only"""
+    return CONFIG_DATA
+
+
+@pytest.fixture(scope="session")
+def config_bytes():
+    """The mock configuration file's contents as JSON bytes"""
+    return CONFIG_BYTES
+
+
+@pytest.fixture(scope="session")
+def mock_config(tmp_path_factory, config_bytes):
+    """Create one mock configuration file shared by every test module"""
+    config_file = tmp_path_factory.mktemp("config") / "config.json"
+    config_file.write_bytes(config_bytes)
+    return str(config_file)
+
+
+@pytest.fixture(scope="session")
+def qtest_api_mock():
+    """One QTestAPI-shaped mock reused by every test; reset by reset_qtest_api_mock"""
+    return MagicMock(spec=QTestAPI)
+
+
+@pytest.fixture(autouse=True)
+def reset_qtest_api_mock(qtest_api_mock):
+    """Clear calls, return values and side effects left by the previous test"""
+    yield
+    qtest_api_mock.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope="session")
+def qtest_cassette():
+    """
+    Intercept HTTP for the whole session and replay tests/cassettes/qtest_api.json.
+    Requests to URLs not in the cassette fail instead of reaching the network.
+    """
+    project_url = f"{CONFIG_DATA['qtest_url']}/api/v3/projects/{CONFIG_DATA['project_id']}"
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        for entry in json.loads((CASSETTE_DIR / "qtest_api.json").read_bytes()):
+            rsps.add(entry['method'], f"{project_url}/{entry['path']}",
+                     json=entry['json'], status=entry['status'])
+        yield rsps
+
+
+@pytest.fixture
+def qtest_http(qtest_cassette):
+    """The replaying RequestsMock with the previous test's calls cleared"""
+    qtest_cassette.calls.reset()
+    return qtest_cassette
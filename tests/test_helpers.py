@@ -0,0 +1,97 @@
+"""
+Unit tests for helper utilities
+"""
+
+import pytest
+from pathlib import Path
+import sys
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from datetime import datetime, timedelta, timezone
+
+from utils.helpers import (calculate_test_summary, format_date_for_qtest, format_execution_time,
+                           parse_test_results_from_dict)
+
+
+def test_parse_test_results_from_dict():
+    """Keys become int test case IDs, missing fields get defaults and statuses are kept as given"""
+    results = parse_test_results_from_dict({
+        '10': {'status': 'failed', 'note': 'boom', 'execution_time': 1500, 'defects': ['BUG-1']},
+        11: {}
+    })
+
+    assert results == [
+        {'test_case_id': 10, 'status': 'failed', 'note': 'boom', 'execution_time': 1500, 'defects': ['BUG-1']},
+        {'test_case_id': 11, 'status': 'PASSED', 'note': '', 'execution_time': 0, 'defects': []}
+    ]
+
+
+def test_calculate_test_summary_counts_statuses_case_insensitively():
+    """Statuses are counted in one pass regardless of case; other statuses only add to the total"""
+    summary = calculate_test_summary([
+        {'status': 'passed', 'execution_time': 1000},
+        {'status': 'PASSED', 'execution_time': 500},
+        {'status': 'Failed', 'execution_time': 300},
+        {'status': 'skipped'},
+        {'status': 'BLOCKED', 'execution_time': 200}
+    ])
+
+    assert summary == {
+        'total': 5,
+        'passed': 2,
+        'failed': 1,
+        'skipped': 1,
+        'pass_rate': 40.0,
+        'total_execution_time': 2000,
+        'avg_execution_time': 400.0
+    }
+
+
+def test_calculate_test_summary_empty():
+    """An empty result list gives zero rates instead of dividing by zero"""
+    summary = calculate_test_summary([])
+
+    assert summary['total'] == 0
+    assert summary['pass_rate'] == 0 and summary['avg_execution_time'] == 0
+
+
+@pytest.mark.parametrize("milliseconds, expected", [
+    (0, "0.00s"),
+    (1234, "1.23s"),
+    (59999, "60.00s"),
+    (60000, "1m 0s"),
+    (90500, "1m 30s"),
+    (3599999, "59m 60s"),
+    (3600000, "1h 0m"),
+    (5430000, "1h 30m"),
+    (90061.5, "1m 30s")
+])
+def test_format_execution_time(milliseconds, expected):
+    """Seconds, minutes and hours are formatted as before the divmod rewrite"""
+    assert format_execution_time(milliseconds) == expected
+
+
+def test_format_execution_time_is_memoized():
+    """Repeated durations are served from the cache"""
+    format_execution_time.cache_clear()
+    format_execution_time(4200)
+    format_execution_time(4200)
+
+    info = format_execution_time.cache_info()
+    assert info.hits == 1 and info.misses == 1
+
+
+def test_format_date_for_qtest_cache_keeps_time_zones_apart():
+    """Equal instants in different zones, naive datetimes and distinct timestamps each keep their own string"""
+    utc = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+    berlin = utc.astimezone(timezone(timedelta(hours=2)))
+    assert utc == berlin
+
+    assert format_date_for_qtest(utc) == "2024-05-01T12:00:00+00:00"
+    assert format_date_for_qtest(berlin) == "2024-05-01T14:00:00+02:00"
+    assert format_date_for_qtest(utc) == "2024-05-01T12:00:00+00:00"
+    assert format_date_for_qtest(datetime(2024, 5, 1, 12, 0)) == "2024-05-01T12:00:00"
+    assert format_date_for_qtest(datetime(2024, 5, 1, 12, 0, 0, 250)) == "2024-05-01T12:00:00.000250"
+    assert format_date_for_qtest(utc + timedelta(seconds=1)) == "2024-05-01T12:00:01+00:00"
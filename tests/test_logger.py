@@ -0,0 +1,52 @@
+"""
+Unit tests for logging utilities
+"""
+
+import logging
+import logging.handlers
+import pytest
+from pathlib import Path
+import sys
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from utils.logger import setup_logger
+
+
+@pytest.fixture
+def logger_name(request):
+    """A logger name unique to the test; its handlers are closed afterwards"""
+    name = f"test_logger.{request.node.name}"
+    yield name
+    logger = logging.getLogger(name)
+    for handler in list(logger.handlers):
+        handler.close()
+        logger.removeHandler(handler)
+
+
+def test_setup_logger_adds_handlers_once(logger_name, tmp_path):
+    """Repeated setup updates the level without stacking handlers"""
+    log_file = tmp_path / "logs" / "run.log"
+
+    first = setup_logger(logger_name, str(log_file))
+    second = setup_logger(logger_name, str(log_file), level='DEBUG')
+
+    assert first is second
+    assert len(second.handlers) == 2
+    assert second.level == logging.DEBUG
+    assert second.handlers[0].formatter is second.handlers[1].formatter
+
+
+def test_setup_logger_opens_file_on_first_write(logger_name, tmp_path):
+    """The rotating file handler creates the log file only when a record is written"""
+    log_file = tmp_path / "logs" / "run.log"
+    logger = setup_logger(logger_name, str(log_file))
+
+    file_handler = logger.handlers[1]
+    assert isinstance(file_handler, logging.handlers.RotatingFileHandler)
+    assert log_file.parent.is_dir() and not log_file.exists()
+
+    logger.info("hello")
+    file_handler.flush()
+    assert log_file.read_text().rstrip().endswith(f"{logger_name} - INFO - hello")
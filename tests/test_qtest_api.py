@@ -0,0 +1,348 @@
+"""
+Unit tests for QTest API wrapper
+"""
+
+import pytest
+import json
+import requests
+from pathlib import Path
+from unittest.mock import Mock, patch
+import sys
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import qtest_api
+from qtest_api import QTestAPI
+
+
+def make_response(status_code=200, json_data=None, headers=None):
+    """Build a fake requests.Response"""
+    response = Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.content = b'{}' if json_data is not None else b''
+    response.json.return_value = json_data
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(response=response)
+    return response
+
+
+def sent_json(call_kwargs):
+    """Decode the JSON body passed to session.request (json= or pre-encoded data=)"""
+    if call_kwargs.get('json') is not None:
+        return call_kwargs['json']
+    return json.loads(call_kwargs['data'])
+
+
+@pytest.fixture
+def api():
+    """Create QTestAPI instance"""
+    return QTestAPI("https://test.qtestnet.com", "test-token-123", 12345)
+
+
+def test_session_headers(api):
+    """Bearer token is normalized and set once on the pooled session"""
+    assert api.session.headers['Authorization'] == 'Bearer test-token-123'
+    assert api.session.headers['Content-Type'] == 'application/json'
+    assert api.session.headers['Accept-Encoding'] == 'gzip, deflate'
+
+
+def test_make_request_uses_session(api):
+    """Requests go through the shared session"""
+    with patch.object(api.session, 'request', return_value=make_response(json_data={'id': 1})) as request:
+        result = api.get_test_case(1)
+
+    assert result == {'id': 1}
+    args, kwargs = request.call_args
+    assert args == ('GET', 'https://test.qtestnet.com/api/v3/projects/12345/test-cases/1')
+
+
+def test_bulk_add_test_logs_unsupported(api):
+    """Bulk endpoint rejection is detected once and cached"""
+    with patch.object(api.session, 'request', return_value=make_response(404)) as request:
+        assert api.bulk_add_test_logs(100, [{'status': {'id': 1}}]) is None
+        assert api.bulk_add_test_logs(100, [{'status': {'id': 1}}]) is None
+
+    request.assert_called_once()
+
+
+def test_execution_statuses_cached(api):
+    """Execution statuses are fetched once until the cache is invalidated"""
+    statuses = [{'id': 1, 'name': 'Passed'}]
+    with patch.object(api.session, 'request', return_value=make_response(json_data=statuses)) as request:
+        assert api.get_execution_statuses() == statuses
+        assert api.get_execution_statuses() == statuses
+        assert request.call_count == 1
+
+        api.invalidate_metadata_cache()
+        api.get_execution_statuses()
+        assert request.call_count == 2
+
+
+def test_find_test_case_id_by_name_uses_index(api):
+    """Test cases are listed once and then resolved from the name index"""
+    api.search_test_cases_by_name = Mock(return_value=None)
+    api.list_test_cases = Mock(return_value=[
+        {'id': 1, 'name': 'Login', 'pid': 'TC-1'},
+        {'id': 2, 'name': 'Search', 'pid': 'TC-2'}
+    ])
+
+    assert api.find_test_case_id_by_name(' login ') == 1
+    assert api.find_test_case_id_by_name('tc-2') == 2
+    assert api.find_test_case_id_by_name('Missing') is None
+    api.list_test_cases.assert_called_once()
+
+
+def test_find_test_case_id_by_name_uses_search(api):
+    """Server-side search avoids listing every test case"""
+    api.list_test_cases = Mock()
+    search_result = {'items': [{'id': 7, 'name': 'Login', 'pid': 'TC-7'}]}
+    with patch.object(api.session, 'request', return_value=make_response(json_data=search_result)) as request:
+        assert api.find_test_case_id_by_name('Login') == 7
+
+    args, kwargs = request.call_args
+    assert args[0] == 'POST'
+    assert sent_json(kwargs)['object_type'] == 'test-cases'
+    api.list_test_cases.assert_not_called()
+
+
+def test_find_test_case_id_by_name_search_miss_uses_index(api):
+    """A case-sensitive search miss falls back to the case-insensitive index"""
+    api.list_test_cases = Mock(return_value=[{'id': 7, 'name': 'Login'}])
+    with patch.object(api.session, 'request', return_value=make_response(json_data={'items': []})):
+        assert api.find_test_case_id_by_name('login') == 7
+
+
+def test_make_request_header_override_is_per_call(api):
+    """Per-call headers are passed through without touching the session defaults"""
+    with patch.object(api.session, 'request', return_value=make_response()) as request:
+        api._make_request('POST', 'test-logs/1/blob-handles', data=b'raw', headers={'Content-Type': 'application/jpeg'})
+        api.get_test_case(1)
+
+    assert request.call_args_list[0].kwargs['headers'] == {'Content-Type': 'application/jpeg'}
+    assert request.call_args_list[1].kwargs['headers'] is None
+    assert api.session.headers['Content-Type'] == 'application/json'
+
+
+def test_attachment_upload_has_no_read_timeout(api, tmp_path):
+    """Attachment uploads keep the connect timeout but have no read limit; API calls keep both"""
+    screenshot = tmp_path / "shot.jpg"
+    screenshot.write_bytes(b'jpeg')
+    with patch.object(api.session, 'request', return_value=make_response()) as request:
+        api.create_attachment(5, [{'file_name': str(screenshot), 'stepnumber': 1}])
+        api.get_test_case(1)
+
+    assert request.call_args_list[0].kwargs['timeout'] == qtest_api.UPLOAD_TIMEOUT == (5, None)
+    assert request.call_args_list[1].kwargs['timeout'] == qtest_api.REQUEST_TIMEOUT
+
+
+def test_list_test_cases_fetches_remaining_pages(api):
+    """All pages are fetched when the first page reports the total count"""
+    def request(method, url, params=None, **kwargs):
+        page = params['page']
+        headers = {'X-Total-Count': '5'} if page == 1 else {}
+        return make_response(json_data=[{'id': page * 10 + i} for i in range(2 if page < 3 else 1)], headers=headers)
+
+    with patch.object(api.session, 'request', side_effect=request) as mock_request:
+        cases = api.list_test_cases(page_size=2)
+
+    assert [c['id'] for c in cases] == [10, 11, 20, 21, 30]
+    assert mock_request.call_count == 3
+
+
+def test_find_test_step_id_by_order_indexes_once(api):
+    """Steps are fetched once per test case and looked up by order"""
+    api.get_test_steps = Mock(return_value=[
+        {'id': 501, 'order': 1},
+        {'id': 502, 'index': '2'},
+        {'id': 503}
+    ])
+
+    assert api.find_test_step_id_by_order(10, 1) == 501
+    assert api.find_test_step_id_by_order(10, 2) == 502
+    assert api.find_test_step_id_by_order(10, 3) is None
+    api.get_test_steps.assert_called_once_with(10)
+
+
+def test_conditional_get_reuses_body_on_not_modified(api):
+    """A 304 reply to If-None-Match returns the previously cached body"""
+    cycles = [{'id': 1, 'name': 'Regression'}]
+    responses = [make_response(json_data=cycles, headers={'ETag': '"v1"'}), make_response(304)]
+    with patch.object(api.session, 'request', side_effect=responses) as request:
+        assert api.get_test_cycles() == cycles
+        assert api.get_test_cycles() == cycles
+
+    assert request.call_args_list[0].kwargs['headers'] is None
+    assert request.call_args_list[1].kwargs['headers'] == {'If-None-Match': '"v1"'}
+
+
+def test_bulk_add_test_logs_single_request(api):
+    """All logs are sent in one request body"""
+    logs = [{'status': {'id': 1}}, {'status': {'id': 2}}]
+    with patch.object(api.session, 'request', return_value=make_response(json_data=[{'id': 1}, {'id': 2}])) as request:
+        assert api.bulk_add_test_logs(100, logs) == [{'id': 1}, {'id': 2}]
+
+    request.assert_called_once()
+    assert sent_json(request.call_args.kwargs) == {'test_logs': logs}
+
+
+def test_find_test_run_id_by_test_case_reuses_listing(api):
+    """Repeated lookups under the same parent share one test run listing"""
+    runs = {'items': [
+        {'id': 900, 'test_case': {'id': 10}},
+        {'id': 901, 'test_case': {'id': 11}}
+    ]}
+    with patch.object(api.session, 'request', return_value=make_response(json_data=runs)) as request:
+        assert api.find_test_run_id_by_test_case(50, 'test-suite', 10) == 900
+        assert api.find_test_run_id_by_test_case(50, 'test-suite', 11) == 901
+        assert api.find_test_run_id_by_test_case(50, 'test-suite', 12) is None
+
+    request.assert_called_once()
+
+
+def test_make_request_compacts_create_payload(api):
+    """Empty top-level fields are stripped from create bodies"""
+    with patch.object(api.session, 'request', return_value=make_response()) as request:
+        api.add_test_log(1, {'note': '', 'defects': [], 'exe_time': 0, 'status': {'id': 1}, 'extra': None})
+
+    assert sent_json(request.call_args.kwargs) == {'exe_time': 0, 'status': {'id': 1}}
+
+
+def test_update_payload_keeps_empty_fields(api):
+    """Updates send empty values as-is so a field can be cleared"""
+    body = {'note': '', 'defects': [], 'status': {'id': 1}, 'extra': None}
+    with patch.object(api.session, 'request', return_value=make_response()) as request:
+        api.update_test_log(1, body)
+
+    assert sent_json(request.call_args.kwargs) == body
+
+
+def test_search_test_cases_paginates(api):
+    """A full page of search results fetches the next page until the results run out"""
+    pages = {1: [{'id': 1, 'name': 'Login'}, {'id': 2, 'name': 'Login'}], 2: [{'id': 3, 'name': 'Login'}]}
+
+    def request(method, url, params=None, **kwargs):
+        return make_response(json_data={'items': pages.get(params['page'], [])})
+
+    with patch.object(api.session, 'request', side_effect=request) as mocked:
+        assert [c['id'] for c in api._search_test_cases("'Name' = 'Login'", size=2)] == [1, 2, 3]
+
+    assert mocked.call_count == 2
+
+
+def test_find_test_case_ids_by_names_chunks_search(api):
+    """Names are resolved with one IN query per chunk"""
+    def request(method, url, json=None, data=None, params=None, **kwargs):
+        query = sent_json({'json': json, 'data': data})['query'].lower()
+        cases = ((1, 'Login'), (2, 'Search'), (3, 'Logout'))
+        items = [{'id': i, 'name': n} for i, n in cases if f"'{n.lower()}'" in query]
+        return make_response(json_data={'items': items})
+
+    api.list_test_cases = Mock(return_value=[])
+    with patch('qtest_api.SEARCH_NAMES_CHUNK_SIZE', 2), \
+            patch.object(api.session, 'request', side_effect=request) as mock_request:
+        found = api.find_test_case_ids_by_names(['Login', 'search', 'Logout', 'Missing'])
+
+    assert found == {'Login': 1, 'search': 2, 'Logout': 3}
+    assert mock_request.call_count == 2
+    assert "'Name' IN (" in sent_json(mock_request.call_args_list[0].kwargs)['query']
+    # only the name the search missed is looked up in the index
+    api.list_test_cases.assert_called_once()
+
+
+def test_find_test_case_ids_by_names_case_sensitive_search(api):
+    """Spellings a case-sensitive search misses are resolved from the index"""
+    def request(method, url, json=None, data=None, params=None, **kwargs):
+        query = sent_json({'json': json, 'data': data})['query']
+        return make_response(json_data={'items': [{'id': 1, 'name': 'Login'}] if "'Login'" in query else []})
+
+    api.list_test_cases = Mock(return_value=[{'id': 1, 'name': 'Login'}, {'id': 2, 'name': 'Search'}])
+    with patch.object(api.session, 'request', side_effect=request):
+        assert api.find_test_case_ids_by_names(['login', 'Login', 'SEARCH']) == {'login': 1, 'Login': 1, 'SEARCH': 2}
+
+
+def test_session_pools_both_schemes(api):
+    """http:// and https:// share the keep-alive adapter and close with the client"""
+    assert api.session.get_adapter('http://example.com') is api.session.get_adapter('https://example.com')
+    with patch.object(api.session, 'close') as close:
+        with api:
+            pass
+    close.assert_called_once()
+
+
+def test_get_or_create_test_cycle_id(api):
+    """Cycles are created only when the name is not already indexed"""
+    api.get_test_cycles = Mock(return_value=[{'id': 1, 'name': 'Smoke'}])
+    api._make_request = Mock(return_value={'id': 2, 'name': 'Regression'})
+
+    assert api.get_or_create_test_cycle_id('smoke') == 1
+    assert api.get_or_create_test_cycle_id('Regression', description='Nightly') == 2
+    assert api.get_or_create_test_cycle_id('regression') == 2
+    api._make_request.assert_called_once_with('POST', 'test-cycles',
+                                              data={'name': 'Regression', 'description': 'Nightly'}, params=None,
+                                              compact=True)
+    # one listing, plus one refresh before creating 'Regression'
+    assert api.get_test_cycles.call_count == 2
+
+
+def test_get_or_create_test_cycle_id_finds_cycle_created_elsewhere(api):
+    """A miss refreshes the cycle index before POSTing, so no duplicate is created"""
+    api.get_test_cycles = Mock(side_effect=[[{'id': 1, 'name': 'Smoke'}],
+                                            [{'id': 1, 'name': 'Smoke'}, {'id': 3, 'name': 'Nightly'}]])
+    api._make_request = Mock()
+
+    assert api.find_test_cycle_id_by_name('Smoke') == 1
+    assert api.get_or_create_test_cycle_id('Nightly') == 3
+    api._make_request.assert_not_called()
+
+
+def test_name_index_expires(api):
+    """The cycle index is rebuilt after the TTL, and sooner when a name is missing"""
+    api.get_test_cycles = Mock(return_value=[{'id': 1, 'name': 'Smoke'}])
+    with patch('qtest_api.time.monotonic', return_value=1000.0) as now:
+        assert api.find_test_cycle_id_by_name('Smoke') == 1
+        now.return_value += qtest_api.NAME_INDEX_MISS_TTL + 1
+        assert api.find_test_cycle_id_by_name('Smoke') == 1
+        assert api.get_test_cycles.call_count == 1
+        assert api.find_test_cycle_id_by_name('Other') is None
+        assert api.get_test_cycles.call_count == 2
+        now.return_value += qtest_api.NAME_INDEX_TTL + 1
+        assert api.find_test_cycle_id_by_name('Smoke') == 1
+        assert api.get_test_cycles.call_count == 3
+
+
+def test_submit_auto_test_logs_posts_to_cycle(api):
+    """Cycle-level logs are posted once to the test cycle's auto-test-logs endpoint"""
+    logs = [{'test_case': {'id': 10}, 'status': {'id': 1}, 'note': ''}]
+    with patch.object(api.session, 'request', return_value=make_response(json_data={'items': [{'id': 5}]})) as request:
+        assert api.submit_auto_test_logs(70, logs) == [{'id': 5}]
+
+    args, kwargs = request.call_args
+    assert args == ('POST', 'https://test.qtestnet.com/api/v3/projects/12345/test-cycles/70/auto-test-logs')
+    assert sent_json(kwargs) == {'test_logs': [{'test_case': {'id': 10}, 'status': {'id': 1}}]}
+
+
+def test_bulk_add_test_logs_returns_queued_task(api):
+    """A 2xx reply without a list of logs is the queued task, not an empty result"""
+    task = {'id': 42, 'type': 'automation', 'state': 'IN_WAITING'}
+    with patch.object(api.session, 'request', return_value=make_response(json_data=task)):
+        assert api.bulk_add_test_logs(100, [{'status': {'id': 1}}]) == task
+
+
+def test_bulk_add_test_logs_bad_request_falls_back_per_batch(api):
+    """HTTP 400 sends this batch down the per-log path without disabling the endpoint"""
+    with patch.object(api.session, 'request', side_effect=[make_response(400), make_response(json_data=[{'id': 1}])]):
+        assert api.bulk_add_test_logs(100, [{'status': {'id': 1}}]) is None
+        assert api.bulk_add_test_logs(100, [{'status': {'id': 1}}]) == [{'id': 1}]
+
+
+def test_retry_policy_never_resends_processed_posts(api):
+    """POST is retried only on 429; idempotent methods also on 5xx; retries end in the last response"""
+    retry = api.session.get_adapter('https://test.qtestnet.com').max_retries
+
+    assert retry.is_retry('POST', 429)
+    assert not retry.is_retry('POST', 503)
+    assert retry.is_retry('GET', 503) and retry.is_retry('PUT', 502)
+    assert not retry._is_method_retryable('POST')
+    assert retry.raise_on_status is False
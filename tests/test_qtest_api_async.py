@@ -0,0 +1,104 @@
+"""
+Unit tests for the async QTest API wrapper
+"""
+
+import asyncio
+import json
+import pytest
+from pathlib import Path
+import sys
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+httpx = pytest.importorskip("httpx")
+
+from qtest_api_async import QTestAPIAsync
+
+
+def run_with_transport(handler, coro_fn):
+    """Run coro_fn(api) against an httpx.MockTransport backed by handler"""
+    async def _run():
+        api = QTestAPIAsync("https://test.qtestnet.com", "test-token-123", 12345,
+                            transport=httpx.MockTransport(handler))
+        async with api:
+            return await coro_fn(api)
+    return asyncio.run(_run())
+
+
+def test_bulk_add_test_logs_falls_back_to_concurrent_posts():
+    """Per-log posts are gathered when the bulk endpoint answers 404"""
+    seen = []
+
+    def handler(request):
+        seen.append(request.url.path)
+        if request.url.path.endswith('/auto-test-logs'):
+            return httpx.Response(404)
+        body = json.loads(request.content)
+        return httpx.Response(201, json={'id': body['test_case_version_id']})
+
+    logs = [{'test_case_version_id': 10}, {'test_case_version_id': 11}]
+    results = run_with_transport(handler, lambda api: api.bulk_add_test_logs(100, logs))
+
+    assert results == [{'id': 10}, {'id': 11}]
+    assert seen.count('/api/v3/projects/12345/test-runs/100/test-logs') == 2
+
+
+def test_bulk_add_test_logs_fallback_is_bounded_by_pool_size():
+    """No more than max_connections per-log posts are in flight at once"""
+    in_flight = peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        if request.url.path.endswith('/auto-test-logs'):
+            return httpx.Response(404)
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(201, json={'id': 1})
+
+    async def _run():
+        async with QTestAPIAsync("https://test.qtestnet.com", "test-token-123", 12345,
+                                 max_connections=3, transport=httpx.MockTransport(handler)) as api:
+            return await api.bulk_add_test_logs(100, [{'note': str(i)} for i in range(20)])
+
+    results = asyncio.run(_run())
+
+    assert results == [{'id': 1}] * 20
+    assert peak == 3
+
+
+def test_bulk_add_test_logs_compacts_logs():
+    """Empty top-level fields are dropped before the logs are sent"""
+    bodies = []
+
+    def handler(request):
+        bodies.append(json.loads(request.content))
+        return httpx.Response(201, json={'items': [{'id': 1}]})
+
+    result = run_with_transport(handler, lambda api: api.bulk_add_test_logs(100, [{'note': '', 'status': {'id': 1}}]))
+
+    assert result == [{'id': 1}]
+    assert bodies == [{'test_logs': [{'status': {'id': 1}}]}]
+
+
+def test_bulk_add_test_logs_returns_queued_task():
+    """A queued-task reply is passed through instead of being read as zero logs"""
+    def handler(request):
+        return httpx.Response(201, json={'id': 42, 'state': 'IN_WAITING'})
+
+    result = run_with_transport(handler, lambda api: api.bulk_add_test_logs(100, [{'note': 'a'}]))
+
+    assert result == {'id': 42, 'state': 'IN_WAITING'}
+
+
+def test_list_test_cases_gathers_pages():
+    """Remaining pages are fetched concurrently once the total is known"""
+    def handler(request):
+        page = int(request.url.params['page'])
+        return httpx.Response(200, json=[{'id': page}], headers={'X-Total-Count': '3'})
+
+    cases = run_with_transport(handler, lambda api: api.list_test_cases(page_size=1))
+
+    assert [c['id'] for c in cases] == [1, 2, 3]
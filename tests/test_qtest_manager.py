@@ -4,9 +4,11 @@ Unit tests for QTest Manager
 
 import pytest
 import json
+import os
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import patch, MagicMock
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent))
@@ -14,34 +16,72 @@ sys.path.append(str(Path(__file__).parent.parent))
 from qtest_manager import QTestManager
 
 
-@pytest.fixture
-def mock_config(tmp_path):
-    """Create a mock configuration file"""
-    config_file = tmp_path / "config.json"
-    config_data = {
-        "qtest_url": "https://test.qtestnet.com",
-        "api_token": "test-token-123",
-        "project_id": 12345,
-        "log_level": "INFO"
-    }
-    config_file.write_text(json.dumps(config_data))
-    return str(config_file)
+@pytest.fixture(scope="module")
+def shared_manager(mock_config):
+    """Create one QTestManager instance with mock config for the module"""
+    with patch('qtest_manager.QTestAPI'):
+        return QTestManager(mock_config)
 
 
 @pytest.fixture
-def qtest_manager(mock_config):
-    """Create QTestManager instance with mock config"""
-    with patch('qtest_manager.QTestAPI'):
-        manager = QTestManager(mock_config)
-        return manager
+def qtest_manager(shared_manager, qtest_api_mock):
+    """The shared manager with the reset API mock and empty caches for each test"""
+    shared_manager.api = qtest_api_mock
+    shared_manager.invalidate_caches()
+    # Drop the invalidate_* calls made just above
+    qtest_api_mock.reset_mock()
+    return shared_manager
 
 
-def test_manager_initialization(mock_config):
+def test_manager_initialization(mock_config, qtest_http):
     """Test QTest Manager initialization"""
-    with patch('qtest_manager.QTestAPI'):
-        manager = QTestManager(mock_config)
-        assert manager.config['qtest_url'] == "https://test.qtestnet.com"
-        assert manager.config['project_id'] == 12345
+    manager = QTestManager(mock_config)
+    assert manager.config['qtest_url'] == "https://test.qtestnet.com"
+    assert manager.config['project_id'] == 12345
+    assert manager.api.base_url == "https://test.qtestnet.com"
+    manager.close()
+
+
+def test_bulk_update_test_results_over_http(mock_config, qtest_http):
+    """The real QTestAPI resolves statuses and bulk-posts logs against the recorded responses"""
+    with QTestManager(mock_config) as manager:
+        results = manager.bulk_update_test_results(100, [
+            {'test_case_id': 10, 'status': 'PASSED', 'note': 'ok'},
+            {'test_case_id': 11, 'status': 'failed'}
+        ])
+
+    assert [r['id'] for r in results] == [9001, 9002]
+    assert [call.request.method for call in qtest_http.calls] == ['GET', 'POST']
+    sent = json.loads(qtest_http.calls[1].request.body)['test_logs']
+    assert [log['status']['id'] for log in sent] == [601, 602]
+
+
+def test_bulk_update_sync_and_async_send_same_body(mock_config, qtest_http):
+    """The sync and async bulk paths send identical auto-test-logs bodies for the same input"""
+    import asyncio
+    from qtest_api_async import QTestAPIAsync
+    httpx = pytest.importorskip("httpx")
+    test_results = [
+        {'test_case_id': 10, 'status': 'PASSED', 'note': ''},
+        {'test_case_id': 11, 'status': 'failed', 'note': 'boom'}
+    ]
+    async_bodies = []
+
+    def handler(request):
+        async_bodies.append(json.loads(request.content))
+        return httpx.Response(201, json={'items': [{'id': 9001}, {'id': 9002}]})
+
+    def async_client(*args, **kwargs):
+        return QTestAPIAsync(*args, transport=httpx.MockTransport(handler), **kwargs)
+
+    with QTestManager(mock_config) as manager:
+        manager.bulk_update_test_results(100, test_results)
+        with patch('qtest_manager.QTestAPIAsync', side_effect=async_client):
+            asyncio.run(manager.bulk_update_test_results_async(100, test_results))
+
+    sync_body = json.loads(qtest_http.calls[-1].request.body)
+    assert async_bodies == [sync_body]
+    assert [log['status']['id'] for log in sync_body['test_logs']] == [601, 602]
 
 
 def test_get_execution_statuses(qtest_manager):
@@ -52,7 +92,7 @@ def test_get_execution_statuses(qtest_manager):
         {'id': 3, 'name': 'Skipped'}
     ]
     
-    qtest_manager.api.get_execution_statuses = Mock(return_value=mock_statuses)
+    qtest_manager.api.get_execution_statuses.return_value = mock_statuses
     
     statuses = qtest_manager.get_execution_statuses()
     
@@ -70,7 +110,7 @@ def test_create_test_run(qtest_manager):
         'web_url': 'https://test.qtestnet.com/p/12345/portal/project#tab=testexecution&object=2&id=100'
     }
     
-    qtest_manager.api.create_test_run = Mock(return_value=mock_response)
+    qtest_manager.api.create_test_run.return_value = mock_response
     
     result = qtest_manager.create_test_run(
         name="Test Run 1",
@@ -88,14 +128,14 @@ def test_update_test_result(qtest_manager):
     mock_statuses = [
         {'id': 1, 'name': 'Passed'}
     ]
-    qtest_manager.api.get_execution_statuses = Mock(return_value=mock_statuses)
+    qtest_manager.api.get_execution_statuses.return_value = mock_statuses
     
     mock_test_log = {
         'id': 200,
         'status': {'id': 1, 'name': 'PASSED'},
         'test_case_version_id': 10
     }
-    qtest_manager.api.add_test_log = Mock(return_value=mock_test_log)
+    qtest_manager.api.add_test_log.return_value = mock_test_log
     
     result = qtest_manager.update_test_result(
         test_run_id=100,
@@ -115,13 +155,13 @@ def test_bulk_update_test_results(qtest_manager):
         {'id': 1, 'name': 'Passed'},
         {'id': 2, 'name': 'Failed'}
     ]
-    qtest_manager.api.get_execution_statuses = Mock(return_value=mock_statuses)
+    qtest_manager.api.get_execution_statuses.return_value = mock_statuses
     
-    qtest_manager.api.add_test_log = Mock(side_effect=[
+    qtest_manager.api.bulk_add_test_logs.return_value = [
         {'id': 201, 'status': {'id': 1, 'name': 'PASSED'}},
         {'id': 202, 'status': {'id': 2, 'name': 'FAILED'}}
-    ])
-    
+    ]
+        
     test_results = [
         {'test_case_id': 10, 'status': 'PASSED', 'note': 'Test 1 passed'},
         {'test_case_id': 11, 'status': 'FAILED', 'note': 'Test 2 failed'}
@@ -132,6 +172,46 @@ def test_bulk_update_test_results(qtest_manager):
     assert len(results) == 2
     assert results[0]['id'] == 201
     assert results[1]['id'] == 202
+    qtest_manager.api.bulk_add_test_logs.assert_called_once()
+    qtest_manager.api.add_test_log.assert_not_called()
+    
+    # Statuses are resolved once and reused by later updates
+    qtest_manager.bulk_update_test_results(100, test_results)
+    qtest_manager.api.get_execution_statuses.assert_called_once()
+    sent = qtest_manager.api.bulk_add_test_logs.call_args.args[1]
+    assert [log['status'] for log in sent] == [{'id': 1, 'name': 'PASSED'}, {'id': 2, 'name': 'FAILED'}]
+
+
+def test_bulk_update_test_results_fallback(qtest_manager):
+    """Bulk update falls back to per-log requests when the bulk endpoint is unsupported"""
+    mock_statuses = [
+        {'id': 1, 'name': 'Passed'},
+        {'id': 2, 'name': 'Failed'}
+    ]
+    qtest_manager.api.get_execution_statuses.return_value = mock_statuses
+    qtest_manager.api.bulk_add_test_logs.return_value = None
+    
+    def add_test_log(test_run_id, test_log_data):
+        # Logs are posted concurrently, so answer by payload rather than call order
+        if test_log_data['test_case_version_id'] == 11:
+            raise Exception('Server error')
+        return {'id': 201, 'status': {'id': 1, 'name': 'PASSED'}}
+    
+    qtest_manager.api.add_test_log.side_effect = add_test_log
+    
+    test_results = [
+        {'test_case_id': 10, 'status': 'PASSED'},
+        {'test_case_id': 11, 'status': 'FAILED'},
+        {'test_case_id': 12, 'status': 'INVALID_STATUS'}
+    ]
+    
+    results = qtest_manager.bulk_update_test_results(100, test_results)
+    
+    assert results[0]['id'] == 201
+    assert results[1] == {'error': 'Server error', 'test_case_id': 11}
+    assert results[2]['test_case_id'] == 12
+    assert 'Invalid status' in results[2]['error']
+    assert qtest_manager.api.add_test_log.call_count == 2
 
 
 def test_invalid_status(qtest_manager):
@@ -139,7 +219,7 @@ def test_invalid_status(qtest_manager):
     mock_statuses = [
         {'id': 1, 'name': 'Passed'}
     ]
-    qtest_manager.api.get_execution_statuses = Mock(return_value=mock_statuses)
+    qtest_manager.api.get_execution_statuses.return_value = mock_statuses
     
     with pytest.raises(ValueError, match="Invalid status"):
         qtest_manager.update_test_result(
@@ -151,9 +231,8 @@ def test_invalid_status(qtest_manager):
 
 def test_ensure_test_run_for_case_found(qtest_manager):
     """Ensure returns existing test run ID without creating a new one."""
-    qtest_manager.api.find_test_run_id_by_test_case = Mock(return_value=999)
-    qtest_manager.api.create_test_run_for_case = Mock()
-
+    qtest_manager.api.find_test_run_id_by_test_case.return_value = 999
+    
     run_id = qtest_manager.ensure_test_run_for_case(
         parent_id=50,
         parent_type='test-suite',
@@ -166,8 +245,8 @@ def test_ensure_test_run_for_case_found(qtest_manager):
 
 def test_ensure_test_run_for_case_create(qtest_manager):
     """Ensure creates a test run when not found and returns new ID."""
-    qtest_manager.api.find_test_run_id_by_test_case = Mock(return_value=None)
-    qtest_manager.api.create_test_run_for_case = Mock(return_value={'id': 1001})
+    qtest_manager.api.find_test_run_id_by_test_case.return_value = None
+    qtest_manager.api.create_test_run_for_case.return_value = {'id': 1001}
 
     run_id = qtest_manager.ensure_test_run_for_case(
         parent_id=50,
@@ -178,3 +257,247 @@ def test_ensure_test_run_for_case_create(qtest_manager):
 
     assert run_id == 1001
     qtest_manager.api.create_test_run_for_case.assert_called_once()
+
+
+def test_create_test_runs_for_cases_batch(qtest_manager):
+    """Test runs for several cases are created with one batch request."""
+    qtest_manager.api.batch_create_test_runs.return_value = [{'id': 1}, {'id': 2}]
+        
+    created = qtest_manager.create_test_runs_for_cases(50, 'test-suite', [10, 11], names=['Login', 'Search'])
+
+    assert created == [{'id': 1}, {'id': 2}]
+    qtest_manager.api.batch_create_test_runs.assert_called_once_with(50, 'test-suite', [
+        {'name': 'Login', 'test_case': {'id': 10}},
+        {'name': 'Search', 'test_case': {'id': 11}}
+    ])
+    qtest_manager.api.get_test_case.assert_not_called()
+    qtest_manager.api.create_test_run_for_case.assert_not_called()
+
+
+def test_create_test_runs_for_cases_fetches_missing_names(qtest_manager):
+    """Only cases without a given name are fetched, and run names keep the case order."""
+    qtest_manager.api.get_test_case.side_effect = lambda case_id: {'name': f'Case {case_id}'}
+    qtest_manager.api.batch_create_test_runs.return_value = [{'id': 1}, {'id': 2}, {'id': 3}]
+
+    qtest_manager.create_test_runs_for_cases(50, 'test-suite', [10, 11, 12], names=['Login'])
+
+    assert qtest_manager.api.get_test_case.call_count == 2
+    qtest_manager.api.batch_create_test_runs.assert_called_once_with(50, 'test-suite', [
+        {'name': 'Login', 'test_case': {'id': 10}},
+        {'name': 'Case 11', 'test_case': {'id': 11}},
+        {'name': 'Case 12', 'test_case': {'id': 12}}
+    ])
+
+
+def test_get_test_case_id_by_name_memoized(qtest_manager):
+    """Repeated name lookups hit the API once."""
+    qtest_manager.api.find_test_case_id_by_name.return_value = 10
+
+    assert qtest_manager.get_test_case_id_by_name('Login') == 10
+    assert qtest_manager.get_test_case_id_by_name(' login ') == 10
+    qtest_manager.api.find_test_case_id_by_name.assert_called_once_with('Login')
+
+
+def test_get_or_create_test_cycle_caches_created_cycle(qtest_manager):
+    """A created cycle is memoized, so later lookups make no API calls."""
+    qtest_manager.api.get_or_create_test_cycle_id.return_value = 77
+    
+    assert qtest_manager.get_or_create_test_cycle_id_by_name('Regression') == 77
+    assert qtest_manager.get_or_create_test_cycle_id_by_name('regression') == 77
+    assert qtest_manager.get_test_cycle_id_by_name('Regression') == 77
+    qtest_manager.api.get_or_create_test_cycle_id.assert_called_once_with('Regression', description=None)
+    qtest_manager.api.find_test_cycle_id_by_name.assert_not_called()
+
+
+def test_resolve_test_case_ids_by_names_batched(qtest_manager):
+    """Uncached names are resolved with a single batched API call"""
+    qtest_manager.api.find_test_case_ids_by_names.return_value = {'Login': 1, 'Search': 2}
+    
+    assert qtest_manager.resolve_test_case_ids_by_names(['Login', 'Missing', 'Search']) == [1, 2]
+    assert qtest_manager.resolve_test_case_ids_by_names(['Search', 'Login']) == [2, 1]
+    qtest_manager.api.find_test_case_ids_by_names.assert_called_once_with(['Login', 'Missing', 'Search'])
+    qtest_manager.api.find_test_case_id_by_name.assert_not_called()
+
+
+def test_load_config_read_once_per_file_version(tmp_path, config_data):
+    """The file is read once until it changes; each manager gets its own mutable config"""
+    mock_config = tmp_path / "config.json"
+    mock_config.write_text(json.dumps(config_data))
+    mock_config = str(mock_config)
+    with patch('qtest_manager.QTestAPI'), patch('builtins.open', wraps=open) as opened:
+        first = QTestManager(mock_config)
+        second = QTestManager(mock_config)
+        assert [c.args[0] for c in opened.call_args_list].count(os.path.abspath(mock_config)) == 1
+
+        first.config['project_id'] = 1
+        first.config['build_version'] = '1.2'
+        assert second.config['project_id'] == 12345 and 'build_version' not in second.config
+
+        config = dict(config_data, project_id=999)
+        Path(mock_config).write_text(json.dumps(config) + "\n")
+        third = QTestManager(mock_config)
+
+    assert third.config['project_id'] == 999
+
+
+def test_load_config_without_orjson(mock_config, config_data):
+    """The stdlib json parser reads the same config when orjson is absent"""
+    with patch('qtest_manager.orjson', None), patch('qtest_manager.QTestAPI'), \
+            patch.dict('qtest_manager._CONFIG_CACHE', clear=True):
+        manager = QTestManager(mock_config)
+
+    assert manager.config == config_data
+
+
+def test_bulk_update_test_results_async(qtest_manager):
+    """Async bulk update reports per-log failures in the usual error shape"""
+    import asyncio
+    from unittest.mock import AsyncMock
+
+    qtest_manager.api.get_execution_statuses.return_value = [
+        {'id': 1, 'name': 'PASSED'},
+        {'id': 2, 'name': 'FAILED'}
+    ]
+    client = MagicMock()
+    client.__aenter__ = AsyncMock(return_value=client)
+    client.__aexit__ = AsyncMock(return_value=False)
+    client.bulk_add_test_logs = AsyncMock(return_value=[{'id': 1}, RuntimeError('boom')])
+
+    test_results = [
+        {'test_case_id': 100, 'status': 'PASSED'},
+        {'test_case_id': 101, 'status': 'FAILED'},
+        {'test_case_id': 102, 'status': 'UNKNOWN'}
+    ]
+    with patch('qtest_manager.QTestAPIAsync', return_value=client):
+        results = asyncio.run(qtest_manager.bulk_update_test_results_async(200, test_results))
+
+    assert results[0] == {'id': 1}
+    assert results[1] == {'error': 'boom', 'test_case_id': 101}
+    assert results[2]['test_case_id'] == 102 and 'error' in results[2]
+    assert len(client.bulk_add_test_logs.call_args.args[1]) == 2
+
+
+def test_get_test_step_id_by_name_indexes_steps(qtest_manager):
+    """Steps are fetched once per test case and matched on name, description or action"""
+    qtest_manager.api.get_test_steps.return_value = [
+        {'id': 1, 'description': 'Open login page', 'name': None},
+        {'id': 2, 'action': ' Enter Credentials '},
+        {'id': 3, 'name': 'open login page'}
+    ]
+
+    assert qtest_manager.get_test_step_id_by_name(10, 'OPEN LOGIN PAGE') == 1
+    assert qtest_manager.get_test_step_id_by_name(10, 'enter credentials') == 2
+    assert qtest_manager.get_test_step_id_by_name(10, 'missing') is None
+    assert qtest_manager.get_test_step_id_by_name(10, '') is None
+    qtest_manager.api.get_test_steps.assert_called_once_with(10)
+
+
+def test_bulk_update_test_results_rejects_incomplete_rows(qtest_manager):
+    """Rows without a test case or status are reported without being submitted"""
+    qtest_manager.api.get_execution_statuses.return_value = [{'id': 1, 'name': 'PASSED'}]
+    qtest_manager.api.bulk_add_test_logs.return_value = [{'id': 1}]
+
+    results = qtest_manager.bulk_update_test_results(200, [
+        {'status': 'PASSED'},
+        {'test_case_id': 101, 'status': 'PASSED'},
+        {'test_case_id': 102}
+    ])
+
+    assert results[0]['test_case_id'] is None and 'error' in results[0]
+    assert results[1] == {'id': 1}
+    assert results[2]['test_case_id'] == 102 and 'error' in results[2]
+    assert len(qtest_manager.api.bulk_add_test_logs.call_args.args[1]) == 1
+
+
+def test_invalidate_caches_forgets_lookups(qtest_manager):
+    """Memoized lookups are refetched after invalidate_caches"""
+    qtest_manager.api.find_test_case_id_by_name.return_value = 10
+
+    qtest_manager.get_test_case_id_by_name('Login')
+    qtest_manager.invalidate_caches()
+    qtest_manager.get_test_case_id_by_name('Login')
+
+    assert qtest_manager.api.find_test_case_id_by_name.call_count == 2
+    qtest_manager.api.invalidate_name_indexes.assert_called_once()
+
+
+def test_invalidate_caches_reloads_execution_statuses(mock_config, qtest_http):
+    """The real QTestAPI refetches execution statuses after invalidate_caches"""
+    with QTestManager(mock_config) as manager:
+        assert manager.get_execution_statuses()['PASSED'] == 601
+        manager.get_execution_statuses()
+        manager.invalidate_caches()
+        assert manager.get_execution_statuses()['PASSED'] == 601
+
+    assert [call.request.url.rsplit('/', 1)[-1] for call in qtest_http.calls] == ['execution-statuses'] * 2
+
+
+def test_submit_cycle_test_results_single_request(qtest_manager):
+    """All results for a cycle go out in one auto-test-logs request"""
+    qtest_manager.api.get_execution_statuses.return_value = [{'id': 1, 'name': 'PASSED'}]
+    qtest_manager.api.submit_auto_test_logs.return_value = [{'id': 301}, {'id': 302}]
+
+    results = qtest_manager.submit_cycle_test_results(70, [
+        {'test_case_id': 10, 'status': 'PASSED'},
+        {'test_case_id': 11, 'status': 'UNKNOWN'},
+        {'test_case_id': 12, 'status': 'passed', 'note': 'ok'}
+    ])
+
+    assert results[0] == {'id': 301}
+    assert results[1]['test_case_id'] == 11 and 'error' in results[1]
+    assert results[2] == {'id': 302}
+    qtest_manager.api.submit_auto_test_logs.assert_called_once()
+    cycle_id, logs = qtest_manager.api.submit_auto_test_logs.call_args.args
+    assert cycle_id == 70
+    assert [log['test_case'] for log in logs] == [{'id': 10}, {'id': 12}]
+    assert all(log['status']['id'] == 1 for log in logs)
+
+
+def test_bulk_fallback_workers_from_config(tmp_path, config_data, qtest_api_mock):
+    """The per-log fallback pool size comes from the config's max_workers key"""
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps(dict(config_data, max_workers=3)))
+    with patch('qtest_manager.QTestAPI', return_value=qtest_api_mock):
+        manager = QTestManager(str(config_file))
+    qtest_api_mock.get_execution_statuses.return_value = [{'id': 1, 'name': 'PASSED'}]
+    qtest_api_mock.bulk_add_test_logs.return_value = None
+    qtest_api_mock.add_test_log.return_value = {'id': 1}
+
+    with patch('qtest_manager.ThreadPoolExecutor', wraps=ThreadPoolExecutor) as executor:
+        manager.bulk_update_test_results(100, [{'test_case_id': 10, 'status': 'PASSED'}])
+
+    executor.assert_called_once_with(max_workers=3)
+
+
+def test_bulk_update_matches_created_logs_by_test_case(qtest_manager):
+    """Created logs naming their test case are matched on its ID, not their position"""
+    qtest_manager.api.get_execution_statuses.return_value = [{'id': 1, 'name': 'PASSED'}]
+    qtest_manager.api.bulk_add_test_logs.return_value = [
+        {'id': 502, 'test_case': {'id': 11}},
+        {'id': 501, 'test_case': {'id': 10}}
+    ]
+
+    results = qtest_manager.bulk_update_test_results(100, [
+        {'test_case_id': 10, 'status': 'PASSED'},
+        {'test_case_id': 12, 'status': 'PASSED'},
+        {'test_case_id': 11, 'status': 'PASSED'}
+    ])
+
+    assert results[0]['id'] == 501
+    assert results[1] == {'error': 'No test log returned', 'test_case_id': 12}
+    assert results[2]['id'] == 502
+
+
+def test_bulk_update_queued_task_is_success(qtest_manager):
+    """A queued auto-test-logs task marks every submitted row as successful"""
+    qtest_manager.api.get_execution_statuses.return_value = [{'id': 1, 'name': 'PASSED'}]
+    qtest_manager.api.bulk_add_test_logs.return_value = {'id': 42, 'state': 'IN_WAITING'}
+
+    results = qtest_manager.bulk_update_test_results(100, [
+        {'test_case_id': 10, 'status': 'PASSED'},
+        {'test_case_id': 11, 'status': 'BOGUS'}
+    ])
+
+    assert results[0] == {'submitted': True, 'task_id': 42, 'test_case_id': 10}
+    assert 'error' in results[1]
+    qtest_manager.api.add_test_log.assert_not_called()
@@ -0,0 +1,263 @@
+"""
+Unit tests for the QTest Robot Framework library
+"""
+
+import pytest
+from pathlib import Path
+from unittest.mock import Mock, patch
+import sys
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from qtest_robot_library import QTestRobotLibrary, _as_int_id
+
+
+@pytest.fixture
+def manager_cls():
+    """Patch the QTestManager class used by the library"""
+    with patch('qtest_robot_library.QTestManager') as manager_cls:
+        yield manager_cls
+
+
+@pytest.fixture
+def library(manager_cls):
+    """Create a library instance with a mocked QTestManager"""
+    lib = QTestRobotLibrary()
+    lib.initialize_qtest_manager('config.json')
+    return lib
+
+
+@pytest.fixture
+def approve():
+    """Stub out test case approval (instances have __slots__, so patch the class)"""
+    with patch.object(QTestRobotLibrary, 'approve_qtest_test_case') as approve:
+        yield approve
+
+
+def test_initialize_reuses_manager_for_same_config(library, manager_cls):
+    """Re-initializing with the same config keeps the pooled manager"""
+    manager = library.manager
+    library.initialize_qtest_manager('config.json')
+
+    assert library.manager is manager
+    manager_cls.assert_called_once_with('config.json')
+
+
+def test_initialize_replaces_manager_for_new_config(library, manager_cls):
+    """A different config closes the old manager and builds a new one"""
+    old_manager = library.manager
+    manager_cls.return_value = Mock()
+    library.initialize_qtest_manager('other.json')
+
+    old_manager.close.assert_called_once()
+    assert library.manager is manager_cls.return_value
+
+
+def test_queued_results_flushed_in_bulk(library):
+    """Queued results are submitted in one bulk call per run at the threshold and on finalize"""
+    library.manager.bulk_update_test_results.side_effect = lambda test_run_id, test_results: [{'id': 1}] * len(test_results)
+
+    with patch('qtest_robot_library.QUEUE_FLUSH_THRESHOLD', 2):
+        library.queue_qtest_result(100, 1, 'passed')
+        library.manager.bulk_update_test_results.assert_not_called()
+        library.queue_qtest_result(100, 2, 'FAILED', 'boom', 1500)
+        library.queue_qtest_result(200, 3, 'PASSED')
+
+    first = library.manager.bulk_update_test_results.call_args_list[0].kwargs
+    assert first['test_run_id'] == 100
+    assert [r['status'] for r in first['test_results']] == ['PASSED', 'FAILED']
+
+    library.finalize_qtest_run()
+    last = library.manager.bulk_update_test_results.call_args.kwargs
+    assert last['test_run_id'] == 200 and len(last['test_results']) == 1
+    assert library.manager.bulk_update_test_results.call_count == 2
+
+
+def test_resolve_tokens_to_ids_mixes_ids_and_names(library):
+    """Numeric tokens are used as IDs; names are resolved once each"""
+    library.manager.get_test_case_id_by_name.side_effect = lambda name: {'Login': 7}.get(name)
+
+    ids, missing = library._resolve_tokens_to_ids([' 12 ', 'Login', 'Missing', 'Login', '-3'])
+
+    assert ids == [12, 7, 7, -3]
+    assert missing == ['Missing']
+    assert library.manager.get_test_case_id_by_name.call_count == 2
+
+
+def test_report_qtest_result_runs_in_background(library, approve):
+    """wait=False submits off the calling thread and is awaited on finalize"""
+    approve.return_value = 55
+    library.manager.update_test_result.return_value = {'id': 900}
+
+    assert library.report_qtest_result(100, 12345, 'passed', message='ok', wait=False) is None
+    library.finalize_qtest_run()
+
+    library.manager.update_test_result.assert_called_once()
+    kwargs = library.manager.update_test_result.call_args.kwargs
+    assert kwargs['status'] == 'PASSED' and kwargs['test_case_version_id'] == 55
+    assert list(library.test_results) == [{'id': 900}]
+    assert library._result_count == 1
+    assert library._pool is None
+
+
+def test_report_qtest_result_waits_by_default(library, approve):
+    """The keyword is synchronous unless wait=False is passed"""
+    approve.return_value = 55
+    library.manager.update_test_result.return_value = {'id': 900}
+
+    assert library.report_qtest_result(100, 12345, 'PASSED') == {'id': 900}
+    assert library._pool is None
+
+
+def test_background_log_messages_emitted_on_main_thread(library):
+    """Approval messages from a worker are buffered and logged by finalize on the calling thread"""
+    import threading
+
+    library.manager.approve_test_case.return_value = {'test_case_version_id': 88}
+    library.manager.update_test_result.return_value = {'id': 900}
+    threads = []
+    with patch('qtest_robot_library.logger') as robot_logger:
+        robot_logger.info.side_effect = lambda msg: threads.append(threading.current_thread())
+        library.report_qtest_result(100, 12345, 'PASSED', wait=False)
+        library._futures[0][1].result()
+        robot_logger.info.assert_not_called()
+
+        library.finalize_qtest_run()
+
+    messages = [c.args[0] for c in robot_logger.info.call_args_list]
+    assert messages[:2] == ["Approved test case ID 12345", "Test result reported: Test Case 12345 - PASSED"]
+    assert set(threads) == {threading.main_thread()}
+
+
+def test_replacing_manager_waits_for_background_work(library, manager_cls, approve):
+    """Queued and background results go out through the old manager before it is closed"""
+    old_manager = library.manager
+    old_manager.update_test_result.return_value = {'id': 900}
+    old_manager.bulk_update_test_results.return_value = [{'id': 901}]
+    library.report_qtest_result(100, 1, 'PASSED', wait=False)
+    library.queue_qtest_result(100, 2, 'PASSED')
+
+    manager_cls.return_value = Mock()
+    library.initialize_qtest_manager('other.json')
+
+    old_manager.update_test_result.assert_called_once()
+    old_manager.bulk_update_test_results.assert_called_once()
+    old_manager.close.assert_called_once()
+    assert library._futures == [] and library._pending_results == {}
+
+
+def test_result_count_covers_every_reporting_path(library, approve):
+    """Bulk, queued and by-name reports are counted alongside single reports"""
+    library.manager.update_test_result.return_value = {'id': 1}
+    library.manager.update_test_result_by_name.return_value = {'id': 2}
+    library.manager.bulk_update_test_results.side_effect = lambda test_run_id, test_results: [
+        {'id': 3}, {'error': 'Invalid status', 'test_case_id': 4}][:len(test_results)]
+
+    library.report_qtest_result(100, 1, 'PASSED')
+    library.report_qtest_result_by_name(100, 'Login', 'PASSED')
+    library.bulk_report_qtest_results(100, [{'test_case_id': 3, 'status': 'PASSED'},
+                                            {'test_case_id': 4, 'status': 'BOGUS'}])
+    library.queue_qtest_result(100, 5, 'PASSED')
+    library.flush_qtest_results()
+
+    assert library._result_count == 4
+    assert [r['id'] for r in library.test_results] == [1, 2, 3, 3]
+
+
+def test_approve_qtest_test_case_once_per_case(library):
+    """Repeated approvals of the same case reuse the first version ID"""
+    library.manager.api.get_test_case.return_value = {'test_case_version_id': 77}
+
+    assert library.approve_qtest_test_case(12345) == 77
+    assert library.approve_qtest_test_case('12345') == 77
+    library.manager.approve_test_case.assert_called_once_with(12345)
+    library.manager.api.get_test_case.assert_called_once_with(12345)
+
+
+def test_normalize_tokens(library):
+    """Comma-separated strings and lists are split into trimmed, non-empty tokens"""
+    assert library._normalize_tokens(' Login , 12,, Search ,') == ['Login', '12', 'Search']
+    assert library._normalize_tokens(['Login ', 12, ' ', None]) == ['Login', '12', 'None']
+    assert library._normalize_tokens(12) == ['12']
+
+
+def test_test_timer_uses_monotonic_clock(library):
+    """Durations come from perf_counter_ns and timers are cleared on finalize"""
+    with patch('qtest_robot_library.time.perf_counter_ns', side_effect=[1_000_000_000, 1_250_000_000]):
+        library.start_test_timer('Login')
+        assert library.get_test_duration_ms('Login') == 250
+
+    library.finalize_qtest_run()
+    assert library.test_start_times == {}
+
+
+def test_module_keywords_forward_to_library_instance():
+    """Module-level keywords are the bound methods of the shared instance"""
+    import qtest_robot_library
+
+    assert qtest_robot_library.report_qtest_result.__self__ is qtest_robot_library._LIB
+    assert 'finalize_qtest_run' in dir(qtest_robot_library)
+    with pytest.raises(AttributeError):
+        qtest_robot_library._normalize_tokens
+
+
+def test_create_qtest_test_run_resolves_first_case_only(library, approve):
+    """Only the first token is resolved for the run"""
+    library.manager.get_test_case_id_by_name.return_value = 7
+    approve.return_value = 70
+    library.manager.create_test_run.return_value = {'id': 500}
+
+    assert library.create_qtest_test_run('Run', 'Login, Search, Logout') == 500
+    library.manager.get_test_case_id_by_name.assert_called_once_with('Login')
+    assert library.manager.create_test_run.call_args.kwargs['test_case_id'] == 7
+
+    library.manager.get_test_case_id_by_name.return_value = None
+    with pytest.raises(ValueError):
+        library.create_qtest_test_run('Run', 'Missing')
+
+
+def test_approve_qtest_test_case_reads_version_from_approval(library):
+    """The approval response's version ID avoids fetching the test case"""
+    library.manager.approve_test_case.return_value = {'id': 12345, 'test_case_version_id': 88}
+
+    assert library.approve_qtest_test_case(12345) == 88
+    library.manager.api.get_test_case.assert_not_called()
+
+
+def test_step_log_payload_debug_skipped_above_debug_level(library):
+    """The payload repr is only built when Robot logs DEBUG messages"""
+    builtin = Mock()
+    builtin.return_value.get_variable_value.return_value = 'INFO'
+    with patch('qtest_robot_library.BuiltIn', builtin), patch('qtest_robot_library.logger') as robot_logger:
+        step = library.create_qtest_test_step_log(None, 1, 'passed', 'ok')
+        library.start_test_timer('Login')
+        library.get_test_duration_ms('Login')
+
+    assert step['status'] == {'id': 601, 'name': 'PASSED'}
+    robot_logger.debug.assert_not_called()
+
+
+def test_debug_level_reread_after_set_log_level(library):
+    """The log level is read once and re-read after a 'Set Log Level'"""
+    builtin = Mock()
+    builtin.return_value.get_variable_value.return_value = 'INFO'
+    with patch('qtest_robot_library.BuiltIn', builtin):
+        assert library._debug_enabled() is False
+        builtin.return_value.get_variable_value.return_value = 'DEBUG'
+        assert library._debug_enabled() is False
+        library.end_keyword('BuiltIn.Set Log Level', {})
+        assert library._debug_enabled() is True
+        assert library._debug_enabled() is True
+
+    assert builtin.return_value.get_variable_value.call_count == 2
+
+
+@pytest.mark.parametrize('value', ['12', ' -3 ', '+5', '1_000', '١٢', 'Login', '5.0', '1__0', '0x10', ''])
+def test_as_int_id_matches_int(value):
+    """Strings are treated as IDs exactly when int() accepts them"""
+    try:
+        expected = int(value)
+    except ValueError:
+        expected = None
+    assert _as_int_id(value) == expected
@@ -0,0 +1,91 @@
+"""
+Unit tests for the setup validation script
+"""
+
+from pathlib import Path
+from unittest.mock import patch
+import sys
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import validate_robot_setup
+
+
+ROBOT_OUTPUT = [
+    "==============================================================================\n",
+    "Simple Qtest Test\n",
+    "Login Works                                                           | PASS |\n",
+    "1 test, 1 passed, 0 failed\n",
+    "Output:  /tmp/test_results/output.xml\n",
+]
+
+
+class FakeRobotProcess:
+    """Stand-in for subprocess.Popen that replays Robot console lines"""
+
+    def __init__(self, args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        self.stdout = iter(ROBOT_OUTPUT)
+        self.returncode = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+def test_check_config_sees_file_created_later(tmp_path, monkeypatch):
+    """The config check reflects the current directory's file on every call"""
+    monkeypatch.chdir(tmp_path)
+    assert validate_robot_setup.check_config() is False
+
+    (tmp_path / "config.json").write_text("{}")
+    assert validate_robot_setup.check_config() is True
+
+
+def test_check_dependencies_probes_without_importing(capsys):
+    """Packages are located with find_spec; nothing is imported and missing ones are reported"""
+    def find_spec(name):
+        return None if name == 'robot' else object()
+
+    with patch('validate_robot_setup.importlib.util.find_spec', side_effect=find_spec) as probe, \
+            patch('builtins.__import__', side_effect=AssertionError('imported')):
+        assert validate_robot_setup.check_dependencies() is False
+
+    assert [c.args[0] for c in probe.call_args_list] == ['robot', 'requests']
+    out = capsys.readouterr().out
+    assert "Robot Framework is NOT installed" in out
+    assert "Requests library is installed" in out
+
+
+def run_simple_test_in(tmp_path, monkeypatch, **kwargs):
+    """Run run_simple_test from a directory holding the simple test file, with Robot faked"""
+    monkeypatch.chdir(tmp_path)
+    test_file = tmp_path / "tests" / "robot" / "simple_qtest_test.robot"
+    test_file.parent.mkdir(parents=True)
+    test_file.write_text("*** Test Cases ***\n")
+    with patch('validate_robot_setup.subprocess.Popen', side_effect=FakeRobotProcess) as popen:
+        assert validate_robot_setup.run_simple_test(**kwargs) is True
+    return popen.call_args.kwargs
+
+
+def test_run_simple_test_quiet_shows_summary_only(tmp_path, monkeypatch, capsys):
+    """Robot output is read from a merged, line-buffered pipe; only statistics and paths are shown"""
+    popen_kwargs = run_simple_test_in(tmp_path, monkeypatch)
+
+    assert popen_kwargs['stdout'] is validate_robot_setup.subprocess.PIPE
+    assert popen_kwargs['stderr'] is validate_robot_setup.subprocess.STDOUT
+    assert popen_kwargs['bufsize'] == 1 and popen_kwargs['text'] is True
+    out = capsys.readouterr().out
+    assert "1 test, 1 passed, 0 failed" in out and "Output:" in out
+    assert "| PASS |" not in out
+
+
+def test_run_simple_test_verbose_echoes_everything(tmp_path, monkeypatch, capsys):
+    """verbose=True passes every Robot line through"""
+    run_simple_test_in(tmp_path, monkeypatch, verbose=True)
+
+    assert "Login Works" in capsys.readouterr().out
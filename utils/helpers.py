@@ -2,7 +2,9 @@
 Helper utility functions
 """
 
+from collections import Counter
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Dict, List, Any
 
 
@@ -16,6 +18,12 @@ def format_date_for_qtest(date_obj: datetime) -> str:
     Returns:
         ISO formatted date string
     """
+    # Aware datetimes compare equal across time zones, so the offset is part of the key
+    return _cached_isoformat(date_obj, date_obj.utcoffset())
+
+
+@lru_cache(maxsize=1024)
+def _cached_isoformat(date_obj: datetime, utcoffset: Any) -> str:
     return date_obj.isoformat()
 
 
@@ -53,12 +61,17 @@ def calculate_test_summary(test_results: List[Dict]) -> Dict:
     Returns:
         Summary dictionary with statistics
     """
-    total = len(test_results)
-    passed = sum(1 for r in test_results if r.get('status', '').upper() == 'PASSED')
-    failed = sum(1 for r in test_results if r.get('status', '').upper() == 'FAILED')
-    skipped = sum(1 for r in test_results if r.get('status', '').upper() == 'SKIPPED')
+    # Single pass: one upper() per result
+    status_counts = Counter()
+    total_execution_time = 0
+    for r in test_results:
+        status_counts[r.get('status', '').upper()] += 1
+        total_execution_time += r.get('execution_time', 0)
     
-    total_execution_time = sum(r.get('execution_time', 0) for r in test_results)
+    total = len(test_results)
+    passed = status_counts['PASSED']
+    failed = status_counts['FAILED']
+    skipped = status_counts['SKIPPED']
     
     return {
         'total': total,
@@ -71,10 +84,13 @@ def calculate_test_summary(test_results: List[Dict]) -> Dict:
     }
 
 
+@lru_cache(maxsize=4096)
 def format_execution_time(milliseconds: int) -> str:
     """
     Format execution time from milliseconds to readable string
     
+    Results are memoized; run durations repeat often in large reports.
+    
     Args:
         milliseconds: Execution time in milliseconds
         
@@ -86,13 +102,12 @@ def format_execution_time(milliseconds: int) -> str:
     if seconds < 60:
         return f"{seconds:.2f}s"
     
-    minutes = int(seconds // 60)
-    remaining_seconds = seconds % 60
+    minutes, remaining_seconds = divmod(seconds, 60)
+    minutes = int(minutes)
     
     if minutes < 60:
         return f"{minutes}m {remaining_seconds:.0f}s"
     
-    hours = int(minutes // 60)
-    remaining_minutes = minutes % 60
+    hours, remaining_minutes = divmod(minutes, 60)
     
     return f"{hours}h {remaining_minutes}m"
@@ -3,14 +3,28 @@ Logging utilities
 """
 
 import logging
+import logging.handlers
 from datetime import datetime
 from pathlib import Path
 
+# Shared by every handler setup_logger creates
+_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+# Log files roll over at this size, keeping LOG_FILE_BACKUPS old files
+LOG_FILE_MAX_BYTES = 10 * 1024 * 1024
+LOG_FILE_BACKUPS = 3
+
 
 def setup_logger(name: str, log_file: str = None, level: str = 'INFO') -> logging.Logger:
     """
     Setup a logger with file and console handlers
     
+    Handlers are only added the first time a logger is set up; later calls
+    with the same name just update the level, so records are not duplicated.
+    
     Args:
         name: Logger name
         log_file: Log file path (optional)
@@ -21,25 +35,23 @@ def setup_logger(name: str, log_file: str = None, level: str = 'INFO') -> loggin
     """
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, level.upper()))
-    
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    if logger.handlers:
+        return logger
     
     # Console handler
     console_handler = logging.StreamHandler()
-    console_handler.setFormatter(formatter)
+    console_handler.setFormatter(_FORMATTER)
     logger.addHandler(console_handler)
     
-    # File handler (if log file specified)
+    # File handler (if log file specified); the file is opened on first write
     if log_file:
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
         
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setFormatter(formatter)
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_file, maxBytes=LOG_FILE_MAX_BYTES, backupCount=LOG_FILE_BACKUPS, delay=True
+        )
+        file_handler.setFormatter(_FORMATTER)
         logger.addHandler(file_handler)
     
     return logger
@@ -3,6 +3,10 @@ Robot Framework QTest Integration - Quick Test
 Validates that Robot Framework can successfully integrate with QTest
 """
 
+import argparse
+import importlib.util
+import os
+import re
 from pathlib import Path
 import subprocess
 import sys
@@ -19,10 +23,10 @@ def check_dependencies():
     
     missing = []
     for module, name in dependencies.items():
-        try:
-            __import__(module)
+        # find_spec only locates the package; it does not run its import
+        if importlib.util.find_spec(module) is not None:
             print(f"✓ {name} is installed")
-        except ImportError:
+        else:
             print(f"✗ {name} is NOT installed")
             missing.append(name)
     
@@ -37,9 +41,7 @@ def check_dependencies():
 
 def check_config():
     """Check if configuration file exists"""
-    config_path = Path("config.json")
-    
-    if not config_path.exists():
+    if not os.path.exists("config.json"):
         print("\n✗ config.json not found!")
         print("Please create config.json with your QTest credentials")
         print("Run: python quick_start.py")
@@ -49,8 +51,18 @@ def check_config():
     return True
 
 
-def run_simple_test():
-    """Run a simple Robot Framework test"""
+# Robot's end-of-run statistics, e.g. "1 test, 1 passed, 0 failed"
+_STATS_LINE_RE = re.compile(r'^\d+ tests?, \d+ passed, \d+ failed')
+
+
+def run_simple_test(verbose: bool = False):
+    """
+    Run a simple Robot Framework test
+    
+    Robot's console output is read line by line from a pipe. With verbose it
+    is echoed as it arrives; otherwise only the final statistics and the
+    output file locations are shown.
+    """
     print("\n" + "="*60)
     print("Running Simple Robot Framework QTest Test")
     print("="*60 + "\n")
@@ -62,24 +74,31 @@ def run_simple_test():
         return False
     
     try:
-        # Run robot test
-        result = subprocess.run(
+        # Run robot test; stderr is merged so a single reader drains both streams
+        with subprocess.Popen(
             [
                 sys.executable, "-m", "robot",
                 "--outputdir", "test_results",
                 "--loglevel", "INFO",
                 str(test_file)
             ],
-            capture_output=False
-        )
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=1,
+            text=True,
+            errors='replace'
+        ) as proc:
+            for line in proc.stdout:
+                if verbose or _STATS_LINE_RE.match(line) or line.startswith(('Output:', 'Log:', 'Report:')):
+                    sys.stdout.write(line)
         
-        if result.returncode == 0:
+        if proc.returncode == 0:
             print("\n✓ Robot Framework test executed successfully!")
             print("\nResults saved in: test_results/")
             print("View report.html for detailed results")
             return True
         else:
-            print(f"\n✗ Test execution failed with return code: {result.returncode}")
+            print(f"\n✗ Test execution failed with return code: {proc.returncode}")
             return False
             
     except Exception as e:
@@ -89,6 +108,10 @@ def run_simple_test():
 
 def main():
     """Main validation function"""
+    parser = argparse.ArgumentParser(description="Validate the Robot Framework QTest setup")
+    parser.add_argument('--verbose', action='store_true', help="Show Robot's full console output")
+    args = parser.parse_args()
+    
     print("="*60)
     print("Robot Framework QTest Integration - Validation")
     print("="*60 + "\n")
@@ -109,7 +132,7 @@ def main():
     response = input("Run a simple test now? (y/n): ").lower()
     
     if response == 'y':
-        success = run_simple_test()
+        success = run_simple_test(verbose=args.verbose)
         sys.exit(0 if success else 1)
     else:
         print("\nValidation completed. You can run tests manually using:")